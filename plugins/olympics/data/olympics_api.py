@@ -25,8 +25,18 @@ import json
 
 try:
     import requests
-    from lxml import html
+    from lxml import etree, html
     SCRAPING_AVAILABLE = True
+
+    # XPath expressions compiled once rather than on every page or row.
+    # Script text comes back as plain str: lxml's default "smart" strings
+    # keep a reference to their parent element and pin the whole DOM.
+    SCRIPT_TEXT_XPATH = etree.XPath('//script/text()', smart_strings=False)
+    MEDAL_CELLS_XPATH = etree.XPath('.//td | .//div[contains(@class, "cell")]')
+    EVENT_SPORT_XPATH = etree.XPath('.//*[contains(@class, "sport")]')
+    EVENT_NAME_XPATH = etree.XPath('.//*[contains(@class, "name") or contains(@class, "title")]')
+    EVENT_TIME_XPATH = etree.XPath('.//*[contains(@class, "time")]')
+    EVENT_ROUND_XPATH = etree.XPath('.//*[contains(@class, "round") or contains(@class, "phase")]')
 except ImportError:
     SCRAPING_AVAILABLE = False
 
@@ -298,13 +308,15 @@ class OlympicsDataFetcher:
             medals = []
 
             # Find script tags containing JSON data
-            scripts = tree.xpath('//script/text()')
+            scripts = [
+                script for script in SCRIPT_TEXT_XPATH(tree)
+                if 'result_medals_data' in script and len(script) >= 1000
+            ]
+            if scripts:
+                # Only the script text is needed now; free the DOM before decoding
+                tree = None
 
             for script in scripts:
-                if 'result_medals_data' not in script:
-                    continue
-                if len(script) < 1000:
-                    continue
 
                 try:
                     data = json.loads(script)
@@ -333,6 +345,8 @@ class OlympicsDataFetcher:
 
             # Fallback: try traditional table parsing
             logger.warning("No embedded JSON found, trying table parsing")
+            if tree is None:
+                tree = html.fromstring(page_content)
             return self._scrape_medals_fallback(tree)
 
         except Exception as e:
@@ -405,7 +419,7 @@ class OlympicsDataFetcher:
     def _parse_medal_row(self, row, default_rank: int) -> Optional[MedalCount]:
         """Parse a single medal table row."""
         # Try to extract text content from cells
-        cells = row.xpath('.//td | .//div[contains(@class, "cell")]')
+        cells = MEDAL_CELLS_XPATH(row)
 
         if len(cells) < 4:
             return None
@@ -606,13 +620,15 @@ class OlympicsDataFetcher:
             events = []
 
             # Find script tags containing schedule JSON
-            scripts = tree.xpath('//script/text()')
+            scripts = [
+                script for script in SCRIPT_TEXT_XPATH(tree)
+                if 'result_schedule_data' in script and len(script) >= 10000
+            ]
+            if scripts:
+                # Only the script text is needed now; free the DOM before decoding
+                tree = None
 
             for script in scripts:
-                if 'result_schedule_data' not in script:
-                    continue
-                if len(script) < 10000:
-                    continue
 
                 try:
                     data = json.loads(script)
@@ -649,6 +665,8 @@ class OlympicsDataFetcher:
 
             # Fallback to selector-based parsing
             logger.warning("No embedded schedule JSON found, trying fallback")
+            if tree is None:
+                tree = html.fromstring(page_content)
             return self._scrape_schedule_fallback(tree)
 
         except Exception as e:
@@ -746,18 +764,18 @@ class OlympicsDataFetcher:
         """Parse a single event item."""
         # Extract sport name (usually in a heading or class)
         sport = ""
-        sport_elem = item.xpath('.//*[contains(@class, "sport")]')
+        sport_elem = EVENT_SPORT_XPATH(item)
         if sport_elem:
             sport = sport_elem[0].text_content().strip()
 
         # Extract event name
         event_name = ""
-        name_elem = item.xpath('.//*[contains(@class, "name") or contains(@class, "title")]')
+        name_elem = EVENT_NAME_XPATH(item)
         if name_elem:
             event_name = name_elem[0].text_content().strip()
 
         # Extract time
-        time_elem = item.xpath('.//*[contains(@class, "time")]')
+        time_elem = EVENT_TIME_XPATH(item)
         start_time = _utcnow()  # Default
         if time_elem:
             time_text = time_elem[0].text_content().strip()
@@ -789,7 +807,7 @@ class OlympicsDataFetcher:
 
         # Extract round info
         round_text = ""
-        round_elem = item.xpath('.//*[contains(@class, "round") or contains(@class, "phase")]')
+        round_elem = EVENT_ROUND_XPATH(item)
         if round_elem:
             round_text = round_elem[0].text_content().strip()
 
@@ -890,13 +908,15 @@ class OlympicsDataFetcher:
             results = []
 
             # Find embedded JSON with medal data
-            scripts = tree.xpath('//script/text()')
+            scripts = [
+                script for script in SCRIPT_TEXT_XPATH(tree)
+                if 'result_medals_data' in script and len(script) >= 1000
+            ]
+            if scripts:
+                # Only the script text is needed now; free the DOM before decoding
+                tree = None
 
             for script in scripts:
-                if 'result_medals_data' not in script:
-                    continue
-                if len(script) < 1000:
-                    continue
 
                 try:
                     data = json.loads(script)
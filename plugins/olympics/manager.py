@@ -379,6 +379,7 @@ class OlympicsPlugin(BasePlugin):
             "UPCOMING"
         )
         self.display_manager.image.paste(summary, (0, 0))
+        self.event_renderer.release_buffer(summary)
 
     def _display_results(self, data: Optional[OlympicsData]) -> None:
         """Display recent results."""
@@ -392,6 +393,7 @@ class OlympicsPlugin(BasePlugin):
             self.display_manager.height
         )
         self.display_manager.image.paste(summary, (0, 0))
+        self.event_renderer.release_buffer(summary)
 
     def _display_medal_race(self, data: Optional[OlympicsData]) -> None:
         """Display medal race comparison between countries."""
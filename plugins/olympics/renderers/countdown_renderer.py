@@ -136,10 +136,13 @@ class CountdownRenderer:
             new_width = int(img_width * scale_ratio)
             new_height = int(img_height * scale_ratio)
 
+            # reducing_gap box-reduces large logos before the LANCZOS pass
             try:
-                resized = self.logo_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                resized = self.logo_image.resize((new_width, new_height), Image.Resampling.LANCZOS,
+                                                 reducing_gap=2.0)
             except AttributeError:
-                resized = self.logo_image.resize((new_width, new_height), Image.LANCZOS)
+                resized = self.logo_image.resize((new_width, new_height), Image.LANCZOS,
+                                                 reducing_gap=2.0)
 
             return resized
         else:
@@ -6,21 +6,20 @@ in both Vegas scroll mode and regular switch mode.
 """
 
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
-try:
-    import pytz
-except ImportError:
-    pytz = None
-
 try:
     from data.data_models import OlympicEvent, EventResult
 except ImportError:
     from ..data.data_models import OlympicEvent, EventResult
 
+from .icon_loader import load_presized_flag, resize_nearest
+
 from typing import Tuple
 
 logger = logging.getLogger(__name__)
@@ -37,6 +36,59 @@ SILVER_COLOR = (192, 192, 192)
 BRONZE_COLOR = (205, 127, 50)
 CYAN = (0, 255, 255)
 
+FLAGS_DIR = Path(__file__).parent.parent / 'assets' / 'country_flags'
+
+def _resolve_timezone(name: str):
+    """
+    Resolve a timezone name to a tzinfo object.
+
+    Prefers stdlib zoneinfo and only imports pytz when zoneinfo is missing
+    or has no data for the name. Unknown names fall back to UTC; returns
+    None when no timezone support is available.
+    """
+    if not name:
+        return None
+
+    try:
+        from zoneinfo import ZoneInfo
+    except ImportError:
+        ZoneInfo = None
+
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo(name)
+        except Exception:
+            pass
+
+    try:
+        import pytz
+    except ImportError:
+        return timezone.utc if ZoneInfo is not None else None
+
+    try:
+        return pytz.timezone(name)
+    except Exception:
+        return pytz.UTC
+
+
+# Card sizing by display height:
+# (max display height, card width, large font size, small font size)
+_SIZE_TIERS = (
+    (32, 80, 8, 6),
+    (64, 100, 10, 8),
+    (float('inf'), 120, 12, 10),
+)
+
+# Maximum number of rendered cards kept in the LRU card cache
+CARD_CACHE_SIZE = 64
+
+# Maximum number of idle frame buffers kept per (width, height)
+BUFFER_POOL_SIZE = 4
+
+# Shared 1x1 canvas used only for text measurement
+_SCRATCH_IMG = Image.new('RGB', (1, 1), BLACK)
+_SCRATCH_DRAW = ImageDraw.Draw(_SCRATCH_IMG)
+
 # Text transformations for event names
 # Includes both abbreviations (to save space) and expansions (for clarity)
 # Note: str.replace is called iteratively, so order matters
@@ -94,23 +146,67 @@ class EventCardRenderer:
         self.config = config
         self.fonts = fonts or {}
         self.timezone_str = config.get('timezone', 'UTC')
-        self.flag_cache: Dict[str, Image.Image] = {}
+        self._tz = _resolve_timezone(self.timezone_str)
+        # (monotonic timestamp, datetime.now(tz)) reused for up to a second
+        self._now_cache: Optional[Tuple[float, datetime]] = None
+        # Pre-sized RGB flag tiles keyed by (country code, (width, height))
+        self.flag_cache: Dict[Tuple[str, Tuple[int, int]], Image.Image] = {}
+        # Decoded RGB flag sources keyed by country code, shared by all sizes
+        self._flag_sources: Dict[str, Image.Image] = {}
+        # Rendered cards keyed by their displayed content (LRU)
+        self._card_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        # Released summary frame buffers available for reuse, keyed by size
+        self._buffer_pool: Dict[Tuple[int, int], List[Image.Image]] = {}
 
         # Calculate card dimensions based on display height
-        if display_height <= 32:
-            self.card_width = 80
-            self.font_size_large = 8
-            self.font_size_small = 6
-        elif display_height <= 64:
-            self.card_width = 100
-            self.font_size_large = 10
-            self.font_size_small = 8
-        else:
-            self.card_width = 120
-            self.font_size_large = 12
-            self.font_size_small = 10
+        for max_height, card_width, font_large, font_small in _SIZE_TIERS:
+            if display_height <= max_height:
+                self.card_width = card_width
+                self.font_size_large = font_large
+                self.font_size_small = font_small
+                break
+
+        # Flag sizes used by result cards (1/3 height) and results summary
+        result_flag_height = display_height // 3
+        self.result_flag_size = (int(result_flag_height * 1.5), result_flag_height)
+        self.summary_flag_size = (10, 7)
+
+        # Layout constants that depend only on display height, computed once
+        # instead of per card: text line pitch and the y offset of each of the
+        # three medal rows on a result card (flag centered within its row)
+        self.line_height = 8 if display_height <= 32 else 10
+        medal_row_height = display_height // 3
+        self.medal_row_offsets = tuple(
+            i * medal_row_height + (medal_row_height - result_flag_height) // 2
+            for i in range(3)
+        )
+        # Top of a vertically centered text block, keyed by row count
+        # (sport row + up to two event-name lines)
+        self.block_start_y = {
+            rows: (display_height - rows * self.line_height) // 2
+            for rows in range(1, 4)
+        }
+        # Live card rows (2px margin and gap); the round row is only shown
+        # when three rows fit
+        live_margin = live_gap = 2
+        live_available = display_height - live_margin * 2
+        self.live_row_ys = {}
+        for rows in (2, 3):
+            block_height = self.line_height * rows + live_gap * (rows - 1)
+            live_start = live_margin + (live_available - block_height) // 2
+            self.live_row_ys[rows] = tuple(
+                live_start + k * (self.line_height + live_gap) for k in range(rows)
+            )
+        self.live_fits_round_row = live_available >= self.line_height * 3 + live_gap * 2
 
         self._init_fonts()
+        self._preload_flags()
+
+        # Medal labels are fixed, so measure them once
+        self._medal_label_w = {
+            label: self._get_text_width(_SCRATCH_DRAW, label, self.font_small)
+            for label in ("G", "S", "B")
+        }
 
     def _init_fonts(self) -> None:
         """Initialize fonts for rendering."""
@@ -130,32 +226,74 @@ class EventCardRenderer:
             self.font_large = ImageFont.load_default()
             self.font_small = self.font_large
 
-    def _load_flag(self, country_code: str, size: Tuple[int, int]) -> Optional[Image.Image]:
-        """Load and cache a country flag image."""
-        cache_key = f"{country_code}_{size[0]}x{size[1]}"
-        if cache_key in self.flag_cache:
-            return self.flag_cache[cache_key]
+    def _preload_flags(self) -> None:
+        """
+        Decode all country flags once and pre-size them for result cards.
 
-        flag_paths = [
-            Path(__file__).parent.parent / 'assets' / 'country_flags' / f"{country_code.lower()}.png",
-            Path(__file__).parent.parent / 'assets' / 'country_flags' / f"{country_code.upper()}.png",
-        ]
+        Avoids PNG decode and resize on the render thread the first time a
+        country appears. Flags are stored as RGB so pastes need no conversion.
+        """
+        try:
+            flag_paths = sorted(FLAGS_DIR.glob('*.png'))
+        except OSError as e:
+            logger.debug(f"Error listing flags in {FLAGS_DIR}: {e}")
+            return
 
         for flag_path in flag_paths:
-            if flag_path.exists():
-                try:
-                    with Image.open(flag_path) as img:
-                        flag = img.resize(size, Image.Resampling.NEAREST)
-                        flag.load()
-                    self.flag_cache[cache_key] = flag
-                    return flag
-                except Exception as e:
-                    logger.debug(f"Error loading flag {flag_path}: {e}")
+            try:
+                with Image.open(flag_path) as img:
+                    source = img.convert('RGB')
+                self._flag_sources[flag_path.stem.upper()] = source
+            except Exception as e:
+                logger.debug(f"Error loading flag {flag_path}: {e}")
 
-        return None
+        for country_code in self._flag_sources:
+            for size in (self.result_flag_size, self.summary_flag_size):
+                self._load_flag(country_code, size)
+
+    def _load_flag(self, country_code: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+        """Load and cache a country flag image."""
+        cache_key = (country_code, size)
+        flag = self.flag_cache.get(cache_key)
+        if flag is not None:
+            return flag
+
+        # Prefer a flag pre-rendered at this size; otherwise resize the source
+        flag = load_presized_flag(country_code, size)
+        if flag is None:
+            source = self._flag_sources.get(country_code.upper())
+            if source is None or size[0] <= 0 or size[1] <= 0:
+                return None
+            flag = resize_nearest(source, size)
+
+        self.flag_cache[cache_key] = flag
+        return flag
+
+    @staticmethod
+    def _paste_flag(img: Image.Image, flag: Image.Image, x: int, y: int) -> None:
+        """
+        Paste a flag tile onto a card.
+
+        Flags are pre-converted to RGB, so when the modes match this goes
+        straight to the core paste and skips Image.paste's argument handling.
+        """
+        if flag.mode == img.mode:
+            img.load()
+            img.im.paste(flag.im, (x, y, x + flag.width, y + flag.height))
+        else:
+            img.paste(flag, (x, y))
 
     def _get_text_width(self, draw: ImageDraw.ImageDraw, text: str, font) -> int:
-        """Get actual pixel width of text with given font."""
+        """
+        Get pixel width of text with given font.
+
+        Uses font.getlength, which sums glyph advances without laying out a
+        bounding box. The draw argument is only used on older PIL versions.
+        """
+        try:
+            return int(font.getlength(text))
+        except AttributeError:
+            pass
         try:
             bbox = draw.textbbox((0, 0), text, font=font)
             return bbox[2] - bbox[0]
@@ -171,36 +309,53 @@ class EventCardRenderer:
         return result
 
     def _truncate_to_width(self, draw: ImageDraw.ImageDraw, text: str,
-                           max_width: int, font) -> str:
-        """Truncate text to fit within pixel width, using actual measurement."""
+                           max_width: int, font, pretransformed: bool = False) -> str:
+        """
+        Truncate text to fit within pixel width, using actual measurement.
+
+        Pass pretransformed=True when text already went through
+        _transform_event_name to skip the second transform pass.
+        """
         # First abbreviate
-        text = self._transform_event_name(text)
+        if not pretransformed:
+            text = self._transform_event_name(text)
+
+        get_width = self._get_text_width
 
         # Check if it fits
-        if self._get_text_width(draw, text, font) <= max_width:
+        if get_width(draw, text, font) <= max_width:
             return text
 
         # Binary search for best fit
         for i in range(len(text), 0, -1):
             truncated = text[:i] + ".."
-            if self._get_text_width(draw, truncated, font) <= max_width:
+            if get_width(draw, truncated, font) <= max_width:
                 return truncated
 
         # Fallback: try progressively smaller strings that fit
         for fallback in ["..", ".", ""]:
-            if self._get_text_width(draw, fallback, font) <= max_width:
+            if get_width(draw, fallback, font) <= max_width:
                 return fallback
 
         return ""
 
     def _get_timezone(self):
         """Get timezone object for formatting."""
-        if pytz and self.timezone_str:
-            try:
-                return pytz.timezone(self.timezone_str)
-            except Exception:
-                return pytz.UTC
-        return None
+        return self._tz
+
+    def _now(self) -> datetime:
+        """Get the current time in the display timezone, cached for up to a second."""
+        mono = time.monotonic()
+        cached = self._now_cache
+        if cached is None or mono - cached[0] > 1.0:
+            cached = (mono, datetime.now(self._tz))
+            self._now_cache = cached
+        return cached[1]
+
+    def _today_and_tomorrow(self) -> Tuple[date, date]:
+        """Get today's and tomorrow's dates in the display timezone."""
+        now = self._now()
+        return now.date(), (now + timedelta(days=1)).date()
 
     def _format_event_time(self, event_time: datetime) -> str:
         """
@@ -208,29 +363,42 @@ class EventCardRenderer:
 
         Returns strings like "10:30 AM TODAY" or "Feb 10 2:00 PM"
         """
-        tz = self._get_timezone()
+        if self._tz:
+            today, tomorrow = self._today_and_tomorrow()
+        else:
+            today = tomorrow = None
+        return self._format_event_time_with_now(event_time, today, tomorrow)
+
+    def _format_event_time_with_now(self, event_time: datetime, today: Optional[date],
+                                    tomorrow: Optional[date]) -> str:
+        """
+        Format event time against precomputed today/tomorrow dates.
+
+        Lets callers formatting several events compute the current date once.
+        """
+        tz = self._tz
 
-        if tz and pytz:
-            # Ensure event_time is timezone-aware
+        if tz:
+            # Ensure event_time is timezone-aware (naive times are UTC)
             if event_time.tzinfo is None:
-                event_time = pytz.UTC.localize(event_time)
+                event_time = event_time.replace(tzinfo=timezone.utc)
 
             local_time = event_time.astimezone(tz)
-            now = datetime.now(tz)
+            local_date = local_time.date()
 
             # Format time
             time_str = local_time.strftime("%I:%M %p").lstrip("0")
 
             # Determine relative date
-            if local_time.date() == now.date():
+            if local_date == today:
                 return f"{time_str} TODAY"
-            elif local_time.date() == (now + timedelta(days=1)).date():
+            elif local_date == tomorrow:
                 return f"{time_str} TMW"
             else:
                 date_str = local_time.strftime("%b %d")
                 return f"{date_str} {time_str}"
         else:
-            # Fallback without pytz
+            # Fallback without timezone support
             return event_time.strftime("%m/%d %H:%M")
 
     def _truncate_text(self, text: str, max_chars: int) -> str:
@@ -244,7 +412,8 @@ class EventCardRenderer:
         return text[:max(0, max_chars - 2)] + ".."
 
     def _split_text_lines(self, text: str, max_width: int, draw: ImageDraw.ImageDraw,
-                           font, max_lines: int = 2) -> List[str]:
+                           font, max_lines: int = 2,
+                           pretransformed: bool = False) -> List[str]:
         """
         Split text into multiple lines to fit within max_width.
 
@@ -254,43 +423,99 @@ class EventCardRenderer:
             draw: ImageDraw for measuring text
             font: Font to use for measurement
             max_lines: Maximum number of lines to produce
+            pretransformed: True if text was already passed through
+                _transform_event_name
 
         Returns:
             List of text lines
         """
+        get_width = self._get_text_width
+
         # If it fits on one line, return as-is
-        if self._get_text_width(draw, text, font) <= max_width:
+        if get_width(draw, text, font) <= max_width:
             return [text]
 
         words = text.split()
+        space_w = get_width(draw, " ", font)
         lines = []
         current_line = ""
+        current_w = 0
 
-        for word in words:
-            test_line = f"{current_line} {word}".strip() if current_line else word
+        # Track the current line width incrementally instead of re-measuring
+        # the whole growing line for every word
+        for idx, word in enumerate(words):
+            word_w = get_width(draw, word, font)
+            test_w = current_w + space_w + word_w if current_line else word_w
 
-            if self._get_text_width(draw, test_line, font) <= max_width:
-                current_line = test_line
+            if test_w <= max_width:
+                current_line = f"{current_line} {word}" if current_line else word
+                current_w = test_w
             else:
                 if current_line:
                     lines.append(current_line)
                     if len(lines) >= max_lines:
                         # Truncate remaining words
-                        remaining = " ".join(words[words.index(word):])
-                        if self._get_text_width(draw, remaining, font) > max_width:
+                        remaining = " ".join(words[idx:])
+                        if get_width(draw, remaining, font) > max_width:
                             # Truncate last line
-                            lines[-1] = self._truncate_to_width(draw, lines[-1], max_width, font)
+                            lines[-1] = self._truncate_to_width(draw, lines[-1], max_width, font,
+                                                                pretransformed)
                         break
                     current_line = word
+                    current_w = word_w
                 else:
                     # Single word too long, truncate it
-                    current_line = self._truncate_to_width(draw, word, max_width, font)
+                    current_line = self._truncate_to_width(draw, word, max_width, font,
+                                                           pretransformed)
+                    current_w = get_width(draw, current_line, font)
 
         if current_line and len(lines) < max_lines:
             lines.append(current_line)
 
         return lines if lines else [text]
 
+    def _get_cached_card(self, key: tuple) -> Optional[Image.Image]:
+        """Return a copy of a previously rendered card, or None on a miss."""
+        card = self._card_cache.get(key)
+        if card is None:
+            return None
+        self._card_cache.move_to_end(key)
+        return card.copy()
+
+    def _cache_card(self, key: tuple, card: Image.Image) -> Image.Image:
+        """Store a rendered card in the LRU cache and return a copy for the caller."""
+        self._card_cache[key] = card
+        self._card_cache.move_to_end(key)
+        while len(self._card_cache) > CARD_CACHE_SIZE:
+            self._card_cache.popitem(last=False)
+        return card.copy()
+
+    def _acquire_buffer(self, width: int, height: int) -> Image.Image:
+        """Get a black RGB frame buffer, reusing a released one when available."""
+        pool = self._buffer_pool.get((width, height))
+        if pool:
+            img = pool.pop()
+            img.paste(BLACK, (0, 0, width, height))
+            return img
+        return Image.new('RGB', (width, height), BLACK)
+
+    def release_buffer(self, img: Image.Image) -> None:
+        """
+        Return a summary image to the buffer pool once it has been displayed.
+
+        The caller must not use the image after releasing it.
+        """
+        pool = self._buffer_pool.setdefault(img.size, [])
+        if len(pool) < BUFFER_POOL_SIZE and all(buf is not img for buf in pool):
+            pool.append(img)
+
+    @staticmethod
+    def _draw_text_items(draw: ImageDraw.ImageDraw, draws: List[tuple]) -> None:
+        """Draw precomputed (x, y, text, font, color) items in a single pass."""
+        draw_text = draw.text
+        for x, y, text, font, color in draws:
+            draw_text((x, y), text, font=font, fill=color)
+
     def render_upcoming_event(self, event: OlympicEvent,
                               card_width: Optional[int] = None) -> Image.Image:
         """
@@ -310,76 +535,73 @@ class EventCardRenderer:
         Returns:
             PIL Image of event card
         """
+        # Time text changes with the current date (TODAY/TMW), so it is part of the key
+        time_text = self._format_event_time(event.start_time)
+        cache_key = ('upcoming', event.event_id, event.sport, event.event_name,
+                     event.is_final, time_text, card_width)
+        cached = self._get_cached_card(cache_key)
+        if cached is not None:
+            return cached
+
         height = self.display_height
         margin = 2
+        font = self.font_small
+        get_width = self._get_text_width
 
         # Prepare text content
         sport_text = event.sport.upper()
         event_text = self._transform_event_name(event.event_name)
-        time_text = self._format_event_time(event.start_time)
         fnl_text = "FNL" if event.is_final else ""
 
         # Calculate text measurements
-        temp_img = Image.new('RGB', (1, 1), BLACK)
-        temp_draw = ImageDraw.Draw(temp_img)
-
-        sport_w = self._get_text_width(temp_draw, sport_text, self.font_small)
-        fnl_w = self._get_text_width(temp_draw, fnl_text, self.font_small) + 6 if event.is_final else 0
-        time_w = self._get_text_width(temp_draw, time_text, self.font_small)
+        sport_w = get_width(_SCRATCH_DRAW, sport_text, font)
+        fnl_w = get_width(_SCRATCH_DRAW, fnl_text, font) + 6 if event.is_final else 0
+        time_w = get_width(_SCRATCH_DRAW, time_text, font)
 
         # Split event name into lines (max line width for left block)
         max_event_line_width = 80  # Reasonable width for event text
-        event_lines = self._split_text_lines(event_text, max_event_line_width, temp_draw,
-                                              self.font_small, max_lines=2)
+        event_lines = self._split_text_lines(event_text, max_event_line_width, _SCRATCH_DRAW,
+                                              font, max_lines=2, pretransformed=True)
 
         # Calculate widths for each line
-        event_lines_w = max(self._get_text_width(temp_draw, line, self.font_small)
+        event_lines_w = max(get_width(_SCRATCH_DRAW, line, font)
                            for line in event_lines)
+        left_block_w = max(sport_w + fnl_w, event_lines_w)
 
         # Calculate width based on content if not specified (for Vegas scroll)
         if card_width is None:
             # Two blocks: left (sport + event lines) + gap + right (time)
-            left_block_w = max(sport_w + fnl_w, event_lines_w)
             width = left_block_w + 12 + time_w + margin * 2
             width = max(width, 80)
         else:
             width = card_width
-            left_block_w = max(sport_w + fnl_w, event_lines_w)
 
-        img = Image.new('RGB', (width, height), BLACK)
-        draw = ImageDraw.Draw(img)
-
-        # Recalculate event lines with actual draw context
-        event_lines = self._split_text_lines(event_text, max_event_line_width, draw,
-                                              self.font_small, max_lines=2)
-
-        # Calculate vertical distribution
-        line_height = 8 if height <= 32 else 10
+        # Vertical distribution (precomputed per row count)
+        line_height = self.line_height
         num_rows = 1 + len(event_lines)  # Sport row + event lines
-        total_text_height = num_rows * line_height
-        start_y = (height - total_text_height) // 2
+        start_y = self.block_start_y[num_rows]
 
         # LEFT BLOCK: Sport + Event lines (vertically centered)
-        y = start_y
-
         # Row 1: Sport name + FNL indicator
-        draw.text((margin, y), sport_text, font=self.font_small, fill=CYAN)
+        draws = [(margin, start_y, sport_text, font, CYAN)]
         if event.is_final:
-            draw.text((margin + sport_w + 6, y), fnl_text, font=self.font_small, fill=GOLD_COLOR)
-        y += line_height
+            draws.append((margin + sport_w + 6, start_y, fnl_text, font, GOLD_COLOR))
 
         # Event name lines
+        y = start_y + line_height
         for line in event_lines:
-            draw.text((margin, y), line, font=self.font_small, fill=WHITE)
+            draws.append((margin, y, line, font, WHITE))
             y += line_height
 
         # RIGHT BLOCK: Time (vertically centered)
-        left_block_w = max(sport_w + fnl_w, event_lines_w)
         time_x = margin + left_block_w + 12
-        time_y = (height - line_height) // 2
-        draw.text((time_x, time_y), time_text, font=self.font_small, fill=YELLOW)
+        time_y = self.block_start_y[1]
+        draws.append((time_x, time_y, time_text, font, YELLOW))
 
-        return img
+        img = Image.new('RGB', (width, height), BLACK)
+        self._draw_text_items(ImageDraw.Draw(img), draws)
+
+        return self._cache_card(cache_key, img)
 
     def render_live_event(self, event: OlympicEvent,
                           card_width: Optional[int] = None) -> Image.Image:
@@ -393,8 +615,16 @@ class EventCardRenderer:
         Returns:
             PIL Image of live event card
         """
+        cache_key = ('live', event.event_id, event.sport, event.event_name,
+                     event.round, card_width)
+        cached = self._get_cached_card(cache_key)
+        if cached is not None:
+            return cached
+
         height = self.display_height
         margin = 2
+        font = self.font_small
+        get_width = self._get_text_width
 
         # Prepare text content
         live_text = "LIVE"
@@ -402,16 +632,14 @@ class EventCardRenderer:
         event_text = self._transform_event_name(event.event_name)
         round_text = self._transform_event_name(event.round) if event.round else ""
 
+        live_w = get_width(_SCRATCH_DRAW, live_text, font)
+
         # Calculate width based on content if not specified (for Vegas scroll)
         if card_width is None:
-            temp_img = Image.new('RGB', (1, 1), BLACK)
-            temp_draw = ImageDraw.Draw(temp_img)
-
-            live_w = self._get_text_width(temp_draw, live_text, self.font_small)
-            sport_w = self._get_text_width(temp_draw, sport_text, self.font_small)
+            sport_w = get_width(_SCRATCH_DRAW, sport_text, font)
             row1_w = live_w + 6 + sport_w  # LIVE + gap + sport
-            event_w = self._get_text_width(temp_draw, event_text, self.font_small)
-            round_w = self._get_text_width(temp_draw, round_text, self.font_small) if round_text else 0
+            event_w = get_width(_SCRATCH_DRAW, event_text, font)
+            round_w = get_width(_SCRATCH_DRAW, round_text, font) if round_text else 0
 
             content_width = max(row1_w, event_w, round_w)
             width = content_width + margin * 2 + 4
@@ -419,51 +647,28 @@ class EventCardRenderer:
         else:
             width = card_width
 
-        img = Image.new('RGB', (width, height), BLACK)
-        draw = ImageDraw.Draw(img)
-
-        # Calculate line height based on display size
-        line_height = 8 if height <= 32 else 10
-        gap = 2
-
-        # Determine how many rows we can fit
-        available_height = height - margin * 2
-        num_rows = 3 if round_text else 2
-        min_height_for_3_rows = line_height * 3 + gap * 2
-
-        # Calculate vertical positions based on available space
-        if num_rows == 3 and available_height < min_height_for_3_rows:
-            # Not enough space for 3 rows, skip round_text
-            num_rows = 2
+        # Row positions are precomputed; drop the round row if it doesn't fit
+        if round_text and not self.live_fits_round_row:
             round_text = ""
-
-        if num_rows == 2:
-            # Two rows: LIVE+sport and event name
-            total_content_height = line_height * 2 + gap
-            start_y = margin + (available_height - total_content_height) // 2
-            y1 = start_y
-            y2 = start_y + line_height + gap
-        else:
-            # Three rows: evenly distributed
-            total_content_height = line_height * 3 + gap * 2
-            start_y = margin + (available_height - total_content_height) // 2
-            y1 = start_y
-            y2 = start_y + line_height + gap
-            y3 = start_y + (line_height + gap) * 2
-
-        # Row 1: "LIVE" + Sport name
-        draw.text((margin, y1), live_text, font=self.font_small, fill=RED)
-        live_w = self._get_text_width(draw, live_text, self.font_small)
-        draw.text((margin + live_w + 6, y1), sport_text, font=self.font_small, fill=CYAN)
-
-        # Row 2: Event name
-        draw.text((margin, y2), event_text, font=self.font_small, fill=WHITE)
+        row_ys = self.live_row_ys[3 if round_text else 2]
+        y1, y2 = row_ys[0], row_ys[1]
+
+        draws = [
+            # Row 1: "LIVE" + Sport name
+            (margin, y1, live_text, font, RED),
+            (margin + live_w + 6, y1, sport_text, font, CYAN),
+            # Row 2: Event name
+            (margin, y2, event_text, font, WHITE),
+        ]
 
         # Row 3: Round info if available and space permits
-        if round_text and num_rows == 3:
-            draw.text((margin, y3), round_text, font=self.font_small, fill=YELLOW)
+        if round_text:
+            draws.append((margin, row_ys[2], round_text, font, YELLOW))
 
-        return img
+        img = Image.new('RGB', (width, height), BLACK)
+        self._draw_text_items(ImageDraw.Draw(img), draws)
+
+        return self._cache_card(cache_key, img)
 
     def render_result_card(self, result: EventResult,
                            card_width: Optional[int] = None) -> Image.Image:
@@ -487,13 +692,21 @@ class EventCardRenderer:
         Returns:
             PIL Image of result card
         """
+        cache_key = ('result', result.event_id, result.sport, result.event_name,
+                     result.gold_athlete, result.gold_country,
+                     result.silver_athlete, result.silver_country,
+                     result.bronze_athlete, result.bronze_country, card_width)
+        cached = self._get_cached_card(cache_key)
+        if cached is not None:
+            return cached
+
         height = self.display_height
         margin = 2
+        font = self.font_small
+        get_width = self._get_text_width
 
         # 1/3 height flags for medals block (larger, prominent)
-        flag_height = height // 3
-        flag_width = int(flag_height * 1.5)
-        flag_size = (flag_width, flag_height)
+        flag_size = self.result_flag_size
 
         # Prepare text content
         sport_text = result.sport.upper()
@@ -505,28 +718,27 @@ class EventCardRenderer:
             ("B", result.bronze_athlete, result.bronze_country, BRONZE_COLOR),
         ]
 
-        # Calculate width based on content
-        temp_img = Image.new('RGB', (1, 1), BLACK)
-        temp_draw = ImageDraw.Draw(temp_img)
-
         # Left block: sport and event with line breaks
-        sport_w = self._get_text_width(temp_draw, sport_text, self.font_small)
+        sport_w = get_width(_SCRATCH_DRAW, sport_text, font)
         max_event_line_width = 70  # Keep left block compact
-        event_lines = self._split_text_lines(event_text, max_event_line_width, temp_draw,
-                                              self.font_small, max_lines=2)
-        event_lines_w = max(self._get_text_width(temp_draw, line, self.font_small)
+        event_lines = self._split_text_lines(event_text, max_event_line_width, _SCRATCH_DRAW,
+                                              font, max_lines=2, pretransformed=True)
+        event_lines_w = max(get_width(_SCRATCH_DRAW, line, font)
                            for line in event_lines)
         left_block_w = max(sport_w, event_lines_w)
 
         # Right block: flag + country + athlete + medal label
+        # Column offsets are measured once per row, relative to the block start
+        flag_step = flag_size[0] + 4
+        medal_label_w = self._medal_label_w
         max_medal_w = 0
+        medal_columns = []
         for label, athlete, country, _ in medalists:
-            label_w = self._get_text_width(temp_draw, label, self.font_small)
-            athlete_w = self._get_text_width(temp_draw, athlete, self.font_small)
-            country_w = self._get_text_width(temp_draw, country, self.font_small)
+            athlete_x = flag_step + get_width(_SCRATCH_DRAW, country, font) + 4
+            label_x = athlete_x + get_width(_SCRATCH_DRAW, athlete, font) + 4
+            medal_columns.append((athlete_x, label_x))
             # Layout: flag + country + athlete + label
-            row_w = flag_size[0] + 4 + country_w + 4 + athlete_w + 4 + label_w
-            max_medal_w = max(max_medal_w, row_w)
+            max_medal_w = max(max_medal_w, label_x + medal_label_w[label])
 
         if card_width is None:
             # Total: left block + gap + right block
@@ -535,56 +747,43 @@ class EventCardRenderer:
         else:
             width = card_width
 
-        img = Image.new('RGB', (width, height), BLACK)
-        draw = ImageDraw.Draw(img)
-
-        # Recalculate event lines with actual draw context
-        event_lines = self._split_text_lines(event_text, max_event_line_width, draw,
-                                              self.font_small, max_lines=2)
-
         # LEFT BLOCK: Sport on top, Event name lines below
-        line_height = 8 if height <= 32 else 10
+        line_height = self.line_height
         num_rows = 1 + len(event_lines)  # Sport + event lines
-        total_left_height = num_rows * line_height
-        left_start_y = (height - total_left_height) // 2
-
-        y = left_start_y
-        draw.text((margin, y), sport_text, font=self.font_small, fill=CYAN)
-        y += line_height
+        left_start_y = self.block_start_y[num_rows]
 
+        draws = [(margin, left_start_y, sport_text, font, CYAN)]
+        y = left_start_y + line_height
         for line in event_lines:
-            draw.text((margin, y), line, font=self.font_small, fill=WHITE)
+            draws.append((margin, y, line, font, WHITE))
             y += line_height
 
         # RIGHT BLOCK: Medals stacked vertically with larger flags
         # Calculate where right block starts
         right_block_x = margin + left_block_w + 12
 
-        # Distribute 3 medal rows across full height
-        row_height = height // 3
-        for i, (label, athlete, country, color) in enumerate(medalists):
-            # Center the content vertically within the row
-            y = i * row_height + (row_height - flag_size[1]) // 2
-            x = right_block_x
+        # Distribute 3 medal rows across full height, content centered in each row
+        country_x = right_block_x + flag_step
+        flags = []
+        for (label, athlete, country, color), (athlete_x, label_x), y in zip(
+                medalists, medal_columns, self.medal_row_offsets):
+            # Flag first (large, prominent), then country, athlete, medal label
+            flags.append((right_block_x, y, country))
+            text_y = y + 1
+            draws.append((country_x, text_y, country, font, color))
+            draws.append((right_block_x + athlete_x, text_y, athlete, font, WHITE))
+            draws.append((right_block_x + label_x, text_y, label, font, color))
 
-            # Flag first (large, prominent)
-            flag = self._load_flag(country, flag_size)
+        img = Image.new('RGB', (width, height), BLACK)
+        load_flag = self._load_flag
+        paste_flag = self._paste_flag
+        for x, y, country in flags:
+            flag = load_flag(country, flag_size)
             if flag:
-                img.paste(flag, (x, y))
-            x += flag_size[0] + 4
-
-            # Country code
-            draw.text((x, y + 1), country, font=self.font_small, fill=color)
-            x += self._get_text_width(draw, country, self.font_small) + 4
-
-            # Athlete name
-            draw.text((x, y + 1), athlete, font=self.font_small, fill=WHITE)
-            x += self._get_text_width(draw, athlete, self.font_small) + 4
+                paste_flag(img, flag, x, y)
+        self._draw_text_items(ImageDraw.Draw(img), draws)
 
-            # Medal label (G/S/B) at end
-            draw.text((x, y + 1), label, font=self.font_small, fill=color)
-
-        return img
+        return self._cache_card(cache_key, img)
 
     def render_events_summary(self, events: List[OlympicEvent],
                               width: int, height: int,
@@ -603,15 +802,18 @@ class EventCardRenderer:
         Returns:
             PIL Image with events summary
         """
-        img = Image.new('RGB', (width, height), BLACK)
+        img = self._acquire_buffer(width, height)
         draw = ImageDraw.Draw(img)
+        draw_text = draw.text
+        font = self.font_small
+        get_width = self._get_text_width
 
         if not events:
-            draw.text((4, height // 2 - 4), "No events", font=self.font_small, fill=GRAY)
+            draw_text((4, height // 2 - 4), "No events", font=font, fill=GRAY)
             return img
 
         # Title
-        draw.text((2, 1), title, font=self.font_small, fill=CYAN)
+        draw_text((2, 1), title, font=font, fill=CYAN)
 
         # Show events
         max_events = 2 if height <= 32 else 4
@@ -621,19 +823,26 @@ class EventCardRenderer:
         row_height = available_height // len(events_to_show)
         start_y = 9
 
+        # Resolve the relative-date reference once for all rows
+        if self._tz:
+            today, tomorrow = self._today_and_tomorrow()
+        else:
+            today = tomorrow = None
+        format_time = self._format_event_time_with_now
+
         for i, event in enumerate(events_to_show):
             y = start_y + (i * row_height)
 
             # Time (compact)
-            time_str = self._format_event_time(event.start_time)
-            time_width = self._get_text_width(draw, time_str[:8], self.font_small)
-            draw.text((2, y), time_str[:8], font=self.font_small, fill=YELLOW)
+            time_str = format_time(event.start_time, today, tomorrow)
+            time_width = get_width(draw, time_str[:8], font)
+            draw_text((2, y), time_str[:8], font=font, fill=YELLOW)
 
             # Sport/Event (use remaining width)
             sport_x = 2 + time_width + 4
             sport_width = width - sport_x - 2
-            event_text = self._truncate_to_width(draw, event.sport, sport_width, self.font_small)
-            draw.text((sport_x, y), event_text, font=self.font_small, fill=WHITE)
+            event_text = self._truncate_to_width(draw, event.sport, sport_width, font)
+            draw_text((sport_x, y), event_text, font=font, fill=WHITE)
 
         return img
 
@@ -650,15 +859,20 @@ class EventCardRenderer:
         Returns:
             PIL Image with results summary
         """
-        img = Image.new('RGB', (width, height), BLACK)
+        img = self._acquire_buffer(width, height)
         draw = ImageDraw.Draw(img)
+        draw_text = draw.text
+        font = self.font_small
+        get_width = self._get_text_width
+        load_flag = self._load_flag
+        paste_flag = self._paste_flag
 
         if not results:
-            draw.text((4, height // 2 - 4), "No results", font=self.font_small, fill=GRAY)
+            draw_text((4, height // 2 - 4), "No results", font=font, fill=GRAY)
             return img
 
         # Title
-        draw.text((2, 1), "RESULTS", font=self.font_small, fill=GREEN)
+        draw_text((2, 1), "RESULTS", font=font, fill=GREEN)
 
         # Show results
         max_results = 2 if height <= 32 else 3
@@ -667,7 +881,7 @@ class EventCardRenderer:
         available_height = height - 10
         row_height = available_height // len(results_to_show)
         start_y = 9
-        flag_size = (10, 7)
+        flag_size = self.summary_flag_size
 
         for i, result in enumerate(results_to_show):
             y = start_y + (i * row_height)
@@ -685,7 +899,7 @@ class EventCardRenderer:
             spacing = 3  # pixels between country groups
             total_country_width = 0
             for country, _ in countries:
-                w = self._get_text_width(draw, country, self.font_small)
+                w = get_width(draw, country, font)
                 country_widths.append(w)
                 # Each group: flag_width + 1px gap + country_width
                 total_country_width += flag_size[0] + 1 + w
@@ -693,20 +907,20 @@ class EventCardRenderer:
 
             # Event name (with abbreviation) - leave room for flags + countries
             event_width = width - total_country_width - 6
-            event_text = self._truncate_to_width(draw, result.event_name, event_width, self.font_small)
-            draw.text((2, y), event_text, font=self.font_small, fill=WHITE)
+            event_text = self._truncate_to_width(draw, result.event_name, event_width, font)
+            draw_text((2, y), event_text, font=font, fill=WHITE)
 
             # Draw flags + country codes with medal colors (right-aligned)
             x = width - total_country_width - 2
             for idx, (country, color) in enumerate(countries):
                 # Flag
-                flag = self._load_flag(country, flag_size)
+                flag = load_flag(country, flag_size)
                 if flag:
-                    img.paste(flag, (x, y))
+                    paste_flag(img, flag, x, y)
                 x += flag_size[0] + 1
 
                 # Country code
-                draw.text((x, y), country, font=self.font_small, fill=color)
+                draw_text((x, y), country, font=font, fill=color)
                 x += country_widths[idx] + spacing
 
         return img
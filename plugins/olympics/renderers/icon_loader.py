@@ -5,21 +5,30 @@ Provides functions to load sport icons and Olympics branding
 for use in renderers.
 """
 
+import json
 import logging
+import mmap
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 from PIL import Image
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
 # Asset paths
 ASSETS_DIR = Path(__file__).parent.parent / "assets"
 SPORT_ICONS_DIR = ASSETS_DIR / "sport_icons"
 BRANDING_DIR = ASSETS_DIR / "branding"
+COUNTRY_FLAGS_DIR = ASSETS_DIR / "country_flags"
 
-# Icon cache
-_icon_cache: Dict[str, Image.Image] = {}
-_branding_cache: Dict[str, Image.Image] = {}
+# Icon caches hold raw RGB pixels and size; hits rebuild via Image.frombytes
+_icon_cache: Dict[str, Tuple[bytes, Tuple[int, int]]] = {}
+_branding_cache: Dict[str, Tuple[bytes, Tuple[int, int]]] = {}
 
 # Sport name normalization map
 SPORT_NAME_MAP = {
@@ -47,6 +56,7 @@ SPORT_NAME_MAP = {
 }
 
 
+@lru_cache(maxsize=256)
 def normalize_sport_name(sport: str) -> str:
     """Convert sport name to icon filename."""
     sport_lower = sport.lower().strip()
@@ -68,8 +78,9 @@ def get_sport_icon(sport: str, size: Optional[Tuple[int, int]] = None) -> Option
     cache_key = f"{icon_name}_{size}" if size else icon_name
 
     # Check cache
-    if cache_key in _icon_cache:
-        return _icon_cache[cache_key].copy()
+    cached = _icon_cache.get(cache_key)
+    if cached is not None:
+        return Image.frombytes("RGB", cached[1], cached[0])
 
     # Try to load icon
     icon_path = SPORT_ICONS_DIR / f"{icon_name}.png"
@@ -81,13 +92,16 @@ def get_sport_icon(sport: str, size: Optional[Tuple[int, int]] = None) -> Option
 
     try:
         with Image.open(icon_path) as img:
+            if size:
+                # Let decoders that support it (JPEG) decode at reduced scale
+                img.draft("RGB", size)
             icon = img.convert("RGB")
             if size and size != icon.size:
                 icon = icon.resize(size, Image.Resampling.NEAREST)
             icon.load()  # Force read all pixel data into memory
 
-        _icon_cache[cache_key] = icon
-        return icon.copy()
+        _icon_cache[cache_key] = (icon.tobytes(), icon.size)
+        return icon
 
     except Exception as e:
         logger.debug(f"Error loading sport icon {icon_name}: {e}")
@@ -106,27 +120,33 @@ def get_olympics_rings(size: Tuple[int, int] = (24, 12)) -> Image.Image:
     """
     cache_key = f"rings_{size}"
 
-    if cache_key in _branding_cache:
-        return _branding_cache[cache_key].copy()
+    cached = _branding_cache.get(cache_key)
+    if cached is not None:
+        return Image.frombytes("RGB", cached[1], cached[0])
 
     # Try to load from file first
     rings_path = BRANDING_DIR / "olympic_rings.png"
     if rings_path.exists():
         try:
             with Image.open(rings_path) as img:
+                img.draft("RGB", size)
                 rings = img.convert("RGB")
                 if size != rings.size:
-                    rings = rings.resize(size, Image.Resampling.LANCZOS)
+                    # Box-reduce large sources before the LANCZOS pass
+                    rings = rings.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
                 rings.load()  # Force read all pixel data into memory
-            _branding_cache[cache_key] = rings
-            return rings.copy()
+            _branding_cache[cache_key] = (rings.tobytes(), rings.size)
+            return rings
         except Exception as e:
             logger.debug(f"Error loading rings from file: {e}")
 
     # Generate programmatically
+    rings_bytes = _PRECOMPUTED.get(("rings", size))
+    if rings_bytes is not None:
+        return Image.frombytes("RGB", size, rings_bytes)
     rings = _generate_olympic_rings(size)
-    _branding_cache[cache_key] = rings
-    return rings.copy()
+    _branding_cache[cache_key] = (rings.tobytes(), rings.size)
+    return rings
 
 
 def _generate_olympic_rings(size: Tuple[int, int]) -> Image.Image:
@@ -184,7 +204,7 @@ def _generate_olympic_rings(size: Tuple[int, int]) -> Image.Image:
 
 
 # Medal icon cache
-_medal_icon_cache: Dict[str, Image.Image] = {}
+_medal_icon_cache: Dict[str, Tuple[bytes, Tuple[int, int]]] = {}
 
 
 def get_medal_icon(medal_type: str, size: Tuple[int, int] = (10, 10)) -> Image.Image:
@@ -198,10 +218,22 @@ def get_medal_icon(medal_type: str, size: Tuple[int, int] = (10, 10)) -> Image.I
     Returns:
         PIL Image of the medal
     """
+    icon_bytes = _PRECOMPUTED.get((medal_type.lower(), size))
+    if icon_bytes is not None:
+        return Image.frombytes("RGB", size, icon_bytes)
+
     cache_key = f"{medal_type.lower()}_{size}"
-    if cache_key in _medal_icon_cache:
-        return _medal_icon_cache[cache_key].copy()
+    cached = _medal_icon_cache.get(cache_key)
+    if cached is not None:
+        return Image.frombytes("RGB", cached[1], cached[0])
+
+    img = _generate_medal_icon(medal_type, size)
+    _medal_icon_cache[cache_key] = (img.tobytes(), img.size)
+    return img
+
 
+def _generate_medal_icon(medal_type: str, size: Tuple[int, int]) -> Image.Image:
+    """Generate a medal icon programmatically."""
     from PIL import ImageDraw
 
     colors = {
@@ -223,15 +255,114 @@ def get_medal_icon(medal_type: str, size: Tuple[int, int] = (10, 10)) -> Image.I
     )
 
     # Add shine effect
-    highlight = tuple(min(255, c + 50) for c in color)
+    highlight = _saturating_add_uint8(color, 50)
     draw.arc(
         [margin + 1, margin + 1, size[0] - margin - 2, size[1] - margin - 2],
         200, 340,
         fill=highlight
     )
 
-    _medal_icon_cache[cache_key] = img
-    return img.copy()
+    return img
+
+
+def _saturating_add_uint8(values: Tuple[int, ...], amount: int) -> Tuple[int, ...]:
+    """Add to 8-bit color channels, clamping to 0..255 instead of wrapping."""
+    return tuple(max(0, min(255, c + amount)) for c in values)
+
+
+@lru_cache(maxsize=64)
+def _nearest_indices(src_len: int, dst_len: int):
+    """
+    Source pixel index PIL's NEAREST filter samples for each output pixel.
+
+    Derived by resizing an index ramp with PIL itself, so a gather with these
+    indices reproduces Image.resize(..., NEAREST) exactly.
+    """
+    ramp = Image.fromarray(np.arange(src_len, dtype=np.int32).reshape(1, src_len))
+    return np.asarray(ramp.resize((dst_len, 1), Image.Resampling.NEAREST))[0].astype(np.intp)
+
+
+def resize_nearest(img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """
+    Nearest-neighbour resize of a small RGB image.
+
+    Uses a numpy integer-index gather with cached per-axis indices when numpy
+    is available, skipping PIL's generic resampler setup; otherwise falls back
+    to Image.resize.
+    """
+    if np is None or img.mode != "RGB":
+        return img.resize(size, Image.Resampling.NEAREST)
+    x_idx = _nearest_indices(img.width, size[0])
+    y_idx = _nearest_indices(img.height, size[1])
+    return Image.fromarray(np.asarray(img)[y_idx[:, None], x_idx])
+
+
+@lru_cache(maxsize=16)
+def _packed_flags(size: Tuple[int, int]):
+    """
+    Memory-map the packed flag file for one size, if scripts/pack_flags.py
+    has produced it.
+
+    Returns:
+        (mmap, {country_code: byte_offset}) or None if no packed file exists
+    """
+    name = f"flags_{size[0]}x{size[1]}"
+    bin_path = COUNTRY_FLAGS_DIR / f"{name}.bin"
+    index_path = COUNTRY_FLAGS_DIR / f"{name}.json"
+    if not bin_path.exists() or not index_path.exists():
+        return None
+
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+        if tuple(index["size"]) != tuple(size):
+            return None
+        with open(bin_path, "rb") as f:
+            packed = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Error opening packed flags {bin_path}: {e}")
+        return None
+
+    return packed, index["offsets"]
+
+
+def load_presized_flag(country_code: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+    """
+    Load a country flag pre-rendered at an exact size.
+
+    scripts/download_flags.py writes sized variants to
+    country_flags/<width>x<height>/<code>.png so renderers can skip resizing;
+    scripts/pack_flags.py packs them into one memory-mapped file per size,
+    which is preferred when present.
+
+    Args:
+        country_code: ISO 3166-1 alpha-3 country code
+        size: Exact flag size (width, height)
+
+    Returns:
+        RGB PIL Image of the flag, or None if no variant exists for this size
+    """
+    packed = _packed_flags(size)
+    if packed is not None:
+        packed_data, offsets = packed
+        offset = offsets.get(country_code.lower())
+        if offset is not None:
+            length = size[0] * size[1] * 3
+            return Image.frombytes("RGB", size, packed_data[offset:offset + length])
+
+    flag_path = COUNTRY_FLAGS_DIR / f"{size[0]}x{size[1]}" / f"{country_code.lower()}.png"
+    if not flag_path.exists():
+        return None
+
+    try:
+        with Image.open(flag_path) as img:
+            flag = img.convert("RGB")
+            flag.load()  # Force read all pixel data into memory
+    except Exception as e:
+        logger.debug(f"Error loading sized flag {flag_path}: {e}")
+        return None
+
+    return flag if flag.size == size else None
 
 
 def load_olympics_logo(size: Optional[Tuple[int, int]] = None) -> Optional[Image.Image]:
@@ -246,8 +377,9 @@ def load_olympics_logo(size: Optional[Tuple[int, int]] = None) -> Optional[Image
     """
     cache_key = f"olympics_logo_{size}" if size else "olympics_logo"
 
-    if cache_key in _branding_cache:
-        return _branding_cache[cache_key].copy()
+    cached = _branding_cache.get(cache_key)
+    if cached is not None:
+        return Image.frombytes("RGB", cached[1], cached[0])
 
     # Try common logo paths
     # Note: ASSETS_DIR.parent == Path(__file__).parent.parent (plugin root)
@@ -260,12 +392,15 @@ def load_olympics_logo(size: Optional[Tuple[int, int]] = None) -> Optional[Image
         if logo_path.exists():
             try:
                 with Image.open(logo_path) as img:
+                    if size:
+                        img.draft("RGB", size)
                     logo = img.convert("RGB")
                     if size and size != logo.size:
-                        logo = logo.resize(size, Image.Resampling.LANCZOS)
+                        # Box-reduce large sources before the LANCZOS pass
+                        logo = logo.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
                     logo.load()  # Force read all pixel data into memory
-                _branding_cache[cache_key] = logo
-                return logo.copy()
+                _branding_cache[cache_key] = (logo.tobytes(), logo.size)
+                return logo
             except Exception as e:
                 logger.debug(f"Error loading Olympics logo from {logo_path}: {e}")
 
@@ -279,3 +414,13 @@ def clear_cache() -> None:
     _icon_cache.clear()
     _branding_cache.clear()
     _medal_icon_cache.clear()
+
+
+# Raw RGB pixels of the programmatic icons at their default sizes, generated
+# once at import so lookups are a single Image.frombytes copy
+_PRECOMPUTED: Dict[Tuple[str, Tuple[int, int]], bytes] = {
+    ("rings", (24, 12)): _generate_olympic_rings((24, 12)).tobytes(),
+}
+for _medal_type in ("gold", "silver", "bronze"):
+    _PRECOMPUTED[(_medal_type, (10, 10))] = _generate_medal_icon(_medal_type, (10, 10)).tobytes()
+del _medal_type
@@ -6,6 +6,7 @@ and regular switch mode.
 """
 
 import logging
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
@@ -15,6 +16,8 @@ try:
 except ImportError:
     from ..data.data_models import MedalCount
 
+from .icon_loader import load_presized_flag, resize_nearest
+
 logger = logging.getLogger(__name__)
 
 # Medal colors (RGB)
@@ -25,6 +28,21 @@ WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 GRAY = (128, 128, 128)
 
+FLAGS_DIR = Path(__file__).parent.parent / 'assets' / 'country_flags'
+
+# Maximum number of memoized text widths before the cache is reset
+TEXT_WIDTH_CACHE_SIZE = 512
+
+# Maximum number of rendered cards kept in the LRU card cache
+CARD_CACHE_SIZE = 128
+
+# Maximum number of pre-rasterized text masks; beyond this, text is drawn
+TEXT_MASK_CACHE_SIZE = 1024
+
+# Shared 1x1 canvas used only for text measurement
+_SCRATCH_IMG = Image.new('RGB', (1, 1), BLACK)
+_SCRATCH_DRAW = ImageDraw.Draw(_SCRATCH_IMG)
+
 
 class MedalCardRenderer:
     """
@@ -47,7 +65,19 @@ class MedalCardRenderer:
         self.display_height = display_height
         self.config = config
         self.fonts = fonts or {}
-        self.flag_cache: Dict[str, Image.Image] = {}
+        # Pre-sized flag tiles keyed by (country code, size); None records a
+        # country with no flag so its files are only checked once
+        self._flag_tiles: Dict[Tuple[str, Tuple[int, int]], Optional[Image.Image]] = {}
+        # Memoized text widths keyed by (text, id(font))
+        self._text_width_cache: Dict[Tuple[str, int], int] = {}
+        # Pre-rasterized text coverage masks keyed by (text, id(font))
+        self._text_masks: Dict[Tuple[str, int], Tuple[Image.Image, Tuple[int, int]]] = {}
+        # Rendered cards keyed by their displayed content (LRU)
+        self._card_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+
+        # Full-height card flag (1px top and bottom margin), 3:2 aspect ratio
+        flag_height = display_height - 2
+        self.flag_size = (int(flag_height * 1.5), flag_height)
 
         # Calculate card dimensions based on display height
         # Standard card width that looks good at various heights
@@ -86,9 +116,73 @@ class MedalCardRenderer:
             self.font_large = ImageFont.load_default()
             self.font_small = self.font_large
 
+        # Line height of the large font, used to center card text
+        try:
+            bbox = _SCRATCH_DRAW.textbbox((0, 0), "Ay", font=self.font_large)
+            self._text_height_large = bbox[3] - bbox[1]
+        except AttributeError:
+            self._text_height_large = 10  # Fallback
+
+        # Ranks are "1st".."99th": measure each ordinal once for card layout
+        self._ordinal_w: Dict[str, int] = {}
+        for n in range(1, 100):
+            ordinal = self._ordinal(n)
+            self._ordinal_w[ordinal] = self._get_text_width(_SCRATCH_DRAW, ordinal, self.font_large)
+
+        # Titles never change, so rasterize them once
+        for title in ("MEDAL COUNT", "MEDAL RACE"):
+            self._add_text_mask(title, self.font_small)
+
+        # Medal counts come from a tiny alphabet: rasterize 0-99 for both
+        # fonts (counts above 99 fall back to draw.text)
+        for font in (self.font_large, self.font_small):
+            for n in range(100):
+                self._add_text_mask(str(n), font)
+
+    def _add_text_mask(self, text: str, font: ImageFont.FreeTypeFont) -> None:
+        """
+        Rasterize text once into a coverage mask for _draw_text to fill.
+
+        The mask spans the text's bounding box; its offset from the draw
+        origin is stored alongside so filling through it blends the same
+        pixels draw.text would, in any color.
+        """
+        key = (text, id(font))
+        if key in self._text_masks:
+            return
+        try:
+            left, top, right, bottom = _SCRATCH_DRAW.textbbox((0, 0), text, font=font)
+        except AttributeError:
+            return  # Fonts without textbbox keep drawing text directly
+        offset_x, offset_y = min(0, left), min(0, top)
+        mask = Image.new('L', (max(1, right - offset_x), max(1, bottom - offset_y)), 0)
+        ImageDraw.Draw(mask).text((-offset_x, -offset_y), text, font=font, fill=255)
+        self._text_masks[key] = (mask, (offset_x, offset_y))
+        self._text_width_cache.setdefault(key, right - left)
+
+    def _draw_text(self, img: Image.Image, draw: ImageDraw.ImageDraw,
+                   xy: Tuple[int, int], text: str, font: ImageFont.FreeTypeFont,
+                   color: Tuple[int, int, int]) -> None:
+        """
+        Draw text by filling through its pre-rasterized mask.
+
+        Masks are built on first use, so FreeType runs once per distinct
+        string and font rather than on every render.
+        """
+        key = (text, id(font))
+        entry = self._text_masks.get(key)
+        if entry is None and len(self._text_masks) < TEXT_MASK_CACHE_SIZE:
+            self._add_text_mask(text, font)
+            entry = self._text_masks.get(key)
+        if entry is None:
+            draw.text(xy, text, font=font, fill=color)
+            return
+        mask, (offset_x, offset_y) = entry
+        img.paste(color, (xy[0] + offset_x, xy[1] + offset_y), mask)
+
     def _load_flag(self, country_code: str, size: Tuple[int, int]) -> Optional[Image.Image]:
         """
-        Load and cache a country flag image.
+        Get a pre-sized country flag image.
 
         Args:
             country_code: ISO 3166-1 alpha-3 country code
@@ -97,28 +191,40 @@ class MedalCardRenderer:
         Returns:
             PIL Image of flag or None if not found
         """
-        cache_key = f"{country_code}_{size[0]}x{size[1]}"
-        if cache_key in self.flag_cache:
-            return self.flag_cache[cache_key]
-
-        # Try to load from assets directory
-        flag_paths = [
-            Path(__file__).parent.parent / 'assets' / 'country_flags' / f"{country_code.lower()}.png",
-            Path(__file__).parent.parent / 'assets' / 'country_flags' / f"{country_code.upper()}.png",
-        ]
-
-        for flag_path in flag_paths:
-            if flag_path.exists():
-                try:
+        cache_key = (country_code.upper(), size)
+        if cache_key in self._flag_tiles:
+            return self._flag_tiles[cache_key]
+
+        # Prefer a flag pre-rendered at this size; otherwise decode just this
+        # country's source flag and resize it
+        flag = load_presized_flag(country_code, size)
+        if flag is None and size[0] > 0 and size[1] > 0:
+            flag_path = FLAGS_DIR / f"{country_code.lower()}.png"
+            try:
+                if flag_path.exists():
                     with Image.open(flag_path) as img:
-                        flag = img.resize(size, Image.Resampling.NEAREST)
-                        flag.load()  # Force read all pixel data into memory
-                    self.flag_cache[cache_key] = flag
-                    return flag
-                except Exception as e:
-                    logger.debug(f"Error loading flag {flag_path}: {e}")
-
-        return None
+                        flag = resize_nearest(img.convert('RGB'), size)
+            except Exception as e:
+                logger.debug(f"Error loading flag {flag_path}: {e}")
+
+        self._flag_tiles[cache_key] = flag
+        return flag
+
+    def _get_cached_card(self, key: tuple) -> Optional[Image.Image]:
+        """Return a copy of a previously rendered card, or None on a miss."""
+        card = self._card_cache.get(key)
+        if card is None:
+            return None
+        self._card_cache.move_to_end(key)
+        return card.copy()
+
+    def _cache_card(self, key: tuple, card: Image.Image) -> Image.Image:
+        """Store a rendered card in the LRU cache and return a copy for the caller."""
+        self._card_cache[key] = card
+        self._card_cache.move_to_end(key)
+        while len(self._card_cache) > CARD_CACHE_SIZE:
+            self._card_cache.popitem(last=False)
+        return card.copy()
 
     def _ordinal(self, n: int) -> str:
         """Convert number to ordinal (1st, 2nd, 3rd, etc.)."""
@@ -147,13 +253,17 @@ class MedalCardRenderer:
         Returns:
             PIL Image of the medal card
         """
+        cache_key = ('card', medal.country_code, medal.rank, medal.gold,
+                     medal.silver, medal.bronze, card_width)
+        cached = self._get_cached_card(cache_key)
+        if cached is not None:
+            return cached
+
         height = self.display_height
         margin = 2
 
         # Full-height flag (only 2px margin total - 1px top, 1px bottom)
-        flag_height = height - 2
-        flag_width = int(flag_height * 1.5)  # Standard flag aspect ratio
-        flag_size = (flag_width, flag_height)
+        flag_size = self.flag_size
 
         # Prepare text content
         rank_text = self._ordinal(medal.rank)
@@ -162,16 +272,16 @@ class MedalCardRenderer:
         silver_text = str(medal.silver)
         bronze_text = str(medal.bronze)
 
+        rank_w = self._ordinal_w.get(rank_text)
+        if rank_w is None:
+            rank_w = self._get_text_width(_SCRATCH_DRAW, rank_text, self.font_large)
+
         # Calculate width based on content if not specified (for Vegas scroll)
         if card_width is None:
-            temp_img = Image.new('RGB', (1, 1), BLACK)
-            temp_draw = ImageDraw.Draw(temp_img)
-
-            rank_w = self._get_text_width(temp_draw, rank_text, self.font_large)
-            country_w = self._get_text_width(temp_draw, country_text, self.font_large)
-            gold_w = self._get_text_width(temp_draw, gold_text, self.font_large)
-            silver_w = self._get_text_width(temp_draw, silver_text, self.font_large)
-            bronze_w = self._get_text_width(temp_draw, bronze_text, self.font_large)
+            country_w = self._get_text_width(_SCRATCH_DRAW, country_text, self.font_large)
+            gold_w = self._get_text_width(_SCRATCH_DRAW, gold_text, self.font_large)
+            silver_w = self._get_text_width(_SCRATCH_DRAW, silver_text, self.font_large)
+            bronze_w = self._get_text_width(_SCRATCH_DRAW, bronze_text, self.font_large)
 
             # Layout: rank | flag | country + medal counts stacked
             medal_counts_w = gold_w + 6 + silver_w + 6 + bronze_w
@@ -184,19 +294,14 @@ class MedalCardRenderer:
         img = Image.new('RGB', (width, height), BLACK)
         draw = ImageDraw.Draw(img)
 
-        # Get actual text height for proper centering
-        try:
-            bbox = draw.textbbox((0, 0), "Ay", font=self.font_large)
-            text_height = bbox[3] - bbox[1]
-        except AttributeError:
-            text_height = 10  # Fallback
+        # Actual text height for proper centering
+        text_height = self._text_height_large
 
         # Layout: Rank | Full-height Flag | Country + Medals (vertically centered)
-        rank_w = self._get_text_width(draw, rank_text, self.font_large)
 
         # Rank on left, vertically centered
         rank_y = (height - text_height) // 2
-        draw.text((margin, rank_y), rank_text, font=self.font_large, fill=WHITE)
+        self._draw_text(img, draw, (margin, rank_y), rank_text, self.font_large, WHITE)
 
         # Full-height flag, centered vertically (should be nearly edge-to-edge)
         flag_x = margin + rank_w + 8
@@ -215,24 +320,24 @@ class MedalCardRenderer:
         start_y = (height - total_text_height) // 2
 
         # Country code on first line
-        draw.text((right_x, start_y), country_text, font=self.font_large, fill=WHITE)
+        self._draw_text(img, draw, (right_x, start_y), country_text, self.font_large, WHITE)
 
         # Medal counts on second line
         medal_y = start_y + text_height + line_spacing
         x = right_x
 
         # Gold count in gold color
-        draw.text((x, medal_y), gold_text, font=self.font_large, fill=GOLD_COLOR)
+        self._draw_text(img, draw, (x, medal_y), gold_text, self.font_large, GOLD_COLOR)
         x += self._get_text_width(draw, gold_text, self.font_large) + 6
 
         # Silver count in silver color
-        draw.text((x, medal_y), silver_text, font=self.font_large, fill=SILVER_COLOR)
+        self._draw_text(img, draw, (x, medal_y), silver_text, self.font_large, SILVER_COLOR)
         x += self._get_text_width(draw, silver_text, self.font_large) + 6
 
         # Bronze count in bronze color
-        draw.text((x, medal_y), bronze_text, font=self.font_large, fill=BRONZE_COLOR)
+        self._draw_text(img, draw, (x, medal_y), bronze_text, self.font_large, BRONZE_COLOR)
 
-        return img
+        return self._cache_card(cache_key, img)
 
     def render_medal_card_compact(self, medal: MedalCount) -> Image.Image:
         """
@@ -250,6 +355,12 @@ class MedalCardRenderer:
         Returns:
             PIL Image of compact medal card
         """
+        cache_key = ('compact', medal.country_code, medal.rank, medal.gold,
+                     medal.silver, medal.bronze, medal.total)
+        cached = self._get_cached_card(cache_key)
+        if cached is not None:
+            return cached
+
         width = self.card_width
         height = self.display_height
 
@@ -261,7 +372,7 @@ class MedalCardRenderer:
         # Row 1: Country + Rank
         y1 = margin
         text1 = f"{medal.country_code} #{medal.rank}"
-        draw.text((margin, y1), text1, font=self.font_large, fill=WHITE)
+        self._draw_text(img, draw, (margin, y1), text1, self.font_large, WHITE)
 
         # Row 2: Medal counts in G-S-B (Total) format
         y2 = height // 2 + 1
@@ -271,27 +382,27 @@ class MedalCardRenderer:
         x = margin
         # Gold count
         gold_str = str(medal.gold)
-        draw.text((x, y2), gold_str, font=self.font_small, fill=GOLD_COLOR)
+        self._draw_text(img, draw, (x, y2), gold_str, self.font_small, GOLD_COLOR)
         x += self._get_text_width(draw, gold_str, self.font_small)
-        draw.text((x, y2), "-", font=self.font_small, fill=GRAY)
+        self._draw_text(img, draw, (x, y2), "-", self.font_small, GRAY)
         x += self._get_text_width(draw, "-", self.font_small)
 
         # Silver count
         silver_str = str(medal.silver)
-        draw.text((x, y2), silver_str, font=self.font_small, fill=SILVER_COLOR)
+        self._draw_text(img, draw, (x, y2), silver_str, self.font_small, SILVER_COLOR)
         x += self._get_text_width(draw, silver_str, self.font_small)
-        draw.text((x, y2), "-", font=self.font_small, fill=GRAY)
+        self._draw_text(img, draw, (x, y2), "-", self.font_small, GRAY)
         x += self._get_text_width(draw, "-", self.font_small)
 
         # Bronze count
         bronze_str = str(medal.bronze)
-        draw.text((x, y2), bronze_str, font=self.font_small, fill=BRONZE_COLOR)
+        self._draw_text(img, draw, (x, y2), bronze_str, self.font_small, BRONZE_COLOR)
         x += self._get_text_width(draw, bronze_str, self.font_small) + 2
 
         # Total
-        draw.text((x, y2), total_text, font=self.font_small, fill=GRAY)
+        self._draw_text(img, draw, (x, y2), total_text, self.font_small, GRAY)
 
-        return img
+        return self._cache_card(cache_key, img)
 
     def render_top_countries(self, medals: List[MedalCount],
                              top_n: int = 5) -> List[Image.Image]:
@@ -322,19 +433,27 @@ class MedalCardRenderer:
         Returns:
             PIL Image with medal summary
         """
+        max_countries = 3 if height <= 32 else 5
+        cache_key = ('summary', width, height) + tuple(
+            (m.rank, m.country_code, m.gold, m.silver, m.bronze)
+            for m in medals[:max_countries]
+        )
+        cached = self._get_cached_card(cache_key)
+        if cached is not None:
+            return cached
+
         img = Image.new('RGB', (width, height), BLACK)
         draw = ImageDraw.Draw(img)
 
         if not medals:
-            draw.text((4, height // 2 - 4), "No medal data", font=self.font_small, fill=GRAY)
-            return img
+            self._draw_text(img, draw, (4, height // 2 - 4), "No medal data", self.font_small, GRAY)
+            return self._cache_card(cache_key, img)
 
         # Title
         title_y = 1
-        draw.text((2, title_y), "MEDAL COUNT", font=self.font_small, fill=WHITE)
+        self._draw_text(img, draw, (2, title_y), "MEDAL COUNT", self.font_small, WHITE)
 
         # Show top 3-5 countries depending on height
-        max_countries = 3 if height <= 32 else 5
         countries = medals[:max_countries]
 
         # Calculate row height
@@ -343,29 +462,32 @@ class MedalCardRenderer:
         start_y = 9
 
         for i, medal in enumerate(countries):
-            y = start_y + (i * row_height)
-
-            # Rank + Country
-            rank_text = f"{medal.rank}."
-            country_text = medal.country_code
-
-            x = 2
-            draw.text((x, y), rank_text, font=self.font_small, fill=GRAY)
-            x += self._get_text_width(draw, rank_text, self.font_small) + 2
-            draw.text((x, y), country_text, font=self.font_small, fill=WHITE)
-
-            # Medal counts on right side
-            medal_x = width - 40
-            # Gold
-            draw.text((medal_x, y), str(medal.gold), font=self.font_small, fill=GOLD_COLOR)
-            medal_x += 12
-            # Silver
-            draw.text((medal_x, y), str(medal.silver), font=self.font_small, fill=SILVER_COLOR)
-            medal_x += 12
-            # Bronze
-            draw.text((medal_x, y), str(medal.bronze), font=self.font_small, fill=BRONZE_COLOR)
+            self._draw_summary_row(img, draw, medal, start_y + (i * row_height), width)
 
-        return img
+        return self._cache_card(cache_key, img)
+
+    def _draw_summary_row(self, img: Image.Image, draw: ImageDraw.ImageDraw,
+                          medal: MedalCount, y: int, width: int) -> None:
+        """Draw one medal summary row (rank, country, counts) at y."""
+        # Rank + Country
+        rank_text = f"{medal.rank}."
+        country_text = medal.country_code
+
+        x = 2
+        self._draw_text(img, draw, (x, y), rank_text, self.font_small, GRAY)
+        x += self._get_text_width(draw, rank_text, self.font_small) + 2
+        self._draw_text(img, draw, (x, y), country_text, self.font_small, WHITE)
+
+        # Medal counts on right side
+        medal_x = width - 40
+        # Gold
+        self._draw_text(img, draw, (medal_x, y), str(medal.gold), self.font_small, GOLD_COLOR)
+        medal_x += 12
+        # Silver
+        self._draw_text(img, draw, (medal_x, y), str(medal.silver), self.font_small, SILVER_COLOR)
+        medal_x += 12
+        # Bronze
+        self._draw_text(img, draw, (medal_x, y), str(medal.bronze), self.font_small, BRONZE_COLOR)
 
     def render_medal_race(self, country1: MedalCount, country2: MedalCount,
                           width: int, height: int) -> Image.Image:
@@ -394,7 +516,7 @@ class MedalCardRenderer:
         margin = 2
 
         # Title
-        draw.text((margin, margin), "MEDAL RACE", font=self.font_small, fill=WHITE)
+        self._draw_text(img, draw, (margin, margin), "MEDAL RACE", self.font_small, WHITE)
 
         # Row 2: Country codes and medal counts
         y2 = height // 3
@@ -402,37 +524,52 @@ class MedalCardRenderer:
 
         # Country 1 (left side)
         c1_text = f"{country1.country_code} {country1.gold}-{country1.silver}-{country1.bronze}"
-        draw.text((margin, y2), c1_text, font=self.font_small, fill=GOLD_COLOR)
+        self._draw_text(img, draw, (margin, y2), c1_text, self.font_small, GOLD_COLOR)
 
         # VS
-        draw.text((mid_x - 8, y2), "vs", font=self.font_small, fill=GRAY)
+        self._draw_text(img, draw, (mid_x - 8, y2), "vs", self.font_small, GRAY)
 
         # Country 2 (right side)
         c2_text = f"{country2.country_code} {country2.gold}-{country2.silver}-{country2.bronze}"
-        draw.text((mid_x + 8, y2), c2_text, font=self.font_small, fill=GOLD_COLOR)
+        self._draw_text(img, draw, (mid_x + 8, y2), c2_text, self.font_small, GOLD_COLOR)
 
         # Row 3: Totals
         y3 = (height * 2) // 3
         t1_text = f"T:{country1.total}"
         t2_text = f"T:{country2.total}"
 
-        draw.text((margin, y3), t1_text, font=self.font_small, fill=WHITE)
-        draw.text((mid_x + 8, y3), t2_text, font=self.font_small, fill=WHITE)
+        self._draw_text(img, draw, (margin, y3), t1_text, self.font_small, WHITE)
+        self._draw_text(img, draw, (mid_x + 8, y3), t2_text, self.font_small, WHITE)
 
         # Highlight winner
         if country1.total > country2.total:
-            draw.text((margin + 30, y3), "+", font=self.font_small, fill=(0, 255, 0))
+            self._draw_text(img, draw, (margin + 30, y3), "+", self.font_small, (0, 255, 0))
         elif country2.total > country1.total:
-            draw.text((mid_x + 38, y3), "+", font=self.font_small, fill=(0, 255, 0))
+            self._draw_text(img, draw, (mid_x + 38, y3), "+", self.font_small, (0, 255, 0))
 
         return img
 
     def _get_text_width(self, draw: ImageDraw.ImageDraw, text: str,
                         font: ImageFont.FreeTypeFont) -> int:
-        """Get width of text with given font."""
+        """
+        Get width of text with given font.
+
+        Medal cards draw from a tiny alphabet (ranks, country codes, counts),
+        so measurements are memoized per (text, font).
+        """
+        key = (text, id(font))
+        width = self._text_width_cache.get(key)
+        if width is not None:
+            return width
+
         try:
             bbox = draw.textbbox((0, 0), text, font=font)
-            return bbox[2] - bbox[0]
+            width = bbox[2] - bbox[0]
         except AttributeError:
             # Fallback for older PIL versions
-            return len(text) * 6
+            width = len(text) * 6
+
+        if len(self._text_width_cache) >= TEXT_WIDTH_CACHE_SIZE:
+            self._text_width_cache.clear()
+        self._text_width_cache[key] = width
+        return width
@@ -0,0 +1,116 @@
+"""
+Shared page fetching and JSON extraction for the Olympics scripts.
+
+Both generate_schedule.py and explore_data.py pull a large JSON blob out of
+an inline <script> on an Olympics.com page. This module holds the pieces
+they share: the keep-alive session setup, the byte-level script slicing
+with its streaming HTML parser fallback.
+"""
+
+import json
+from typing import Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+
+# orjson parses the multi-MB embedded JSON several times faster; its
+# JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Page bytes fed to the streaming HTML parser per step
+PARSE_CHUNK_SIZE = 64 * 1024
+
+
+def make_session(headers: Dict[str, str]) -> requests.Session:
+    """Create a keep-alive session so retries reuse the open HTTPS connection."""
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4, pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.5)
+    ))
+    return session
+
+
+def iter_scripts(page_content: bytes) -> Iterator[str]:
+    """
+    Yield the text of each <script> in the page as it is parsed.
+
+    Streams the page through a pull parser so callers can stop at the first
+    matching script; the huge_tree parser accepts multi-MB inline scripts and
+    collect_ids=False skips indexing element IDs that are never looked up.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="script",
+                                  huge_tree=True, collect_ids=False)
+    for start in range(0, len(page_content), PARSE_CHUNK_SIZE):
+        parser.feed(page_content[start:start + PARSE_CHUNK_SIZE])
+        for _, elem in parser.read_events():
+            if elem.text:
+                yield elem.text
+            elem.clear()
+    parser.close()
+    for _, elem in parser.read_events():
+        if elem.text:
+            yield elem.text
+
+
+def slice_script(page_content: bytes, key: str) -> Optional[bytes]:
+    """
+    Locate the <script> body containing key with plain byte searches.
+
+    Returns the stripped body between the opening tag and </script> if it
+    looks like a JSON object, without building any HTML tree, or None if no
+    such script can be found.
+    """
+    key_pos = page_content.find(f'"{key}"'.encode())
+    if key_pos < 0:
+        return None
+    tag_start = page_content.rfind(b"<script", 0, key_pos)
+    body_start = page_content.find(b">", tag_start) + 1
+    body_end = page_content.find(b"</script>", key_pos)
+    if tag_start < 0 or body_start <= 0 or body_start > key_pos or body_end < 0:
+        return None
+
+    blob = page_content[body_start:body_end].strip()
+    if not (blob.startswith(b"{") and blob.endswith(b"}")):
+        return None
+    return blob
+
+
+def find_script_json(page_content: bytes, key: str, min_length: int = 0) -> Optional[dict]:
+    """
+    Find and parse the inline JSON script whose top level holds key.
+
+    Tries the byte-level slice first and falls back to the streaming HTML
+    parser, skipping scripts shorter than min_length.
+
+    Returns:
+        The parsed top-level JSON object, or None if no script holds key
+    """
+    candidates = []
+    sliced = slice_script(page_content, key)
+    if sliced is not None:
+        candidates.append(sliced)
+
+    for blob in _chain_scripts(candidates, page_content, key, min_length):
+        try:
+            data = json_loads(blob)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if isinstance(data, dict) and key in data:
+            return data
+
+    return None
+
+
+def _chain_scripts(candidates, page_content: bytes, key: str, min_length: int):
+    """Yield the sliced candidates, then every matching script from the parser."""
+    yield from candidates
+    for script in iter_scripts(page_content):
+        if key in script and len(script) >= min_length:
+            yield script
@@ -3,7 +3,8 @@
 Download country flags from flagcdn.com for the Olympics plugin.
 
 Downloads low-resolution flag images suitable for LED matrix displays.
-Saves to assets/country_flags/ with ISO 3166-1 alpha-3 naming.
+Saves to assets/country_flags/ with ISO 3166-1 alpha-3 naming, plus
+pre-sized variants in assets/country_flags/<width>x<height>/.
 
 Usage:
     python scripts/download_flags.py
@@ -11,21 +12,39 @@ Usage:
 
 import os
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
 from pathlib import Path
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     from PIL import Image
 except ImportError:
     print("Required packages not installed. Run:")
     print("  pip install requests pillow")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Target flag size for LED matrix (width x height)
 FLAG_SIZE = (16, 10)
 
+# Additional pre-sized variants written to country_flags/<w>x<h>/ so the
+# renderers can skip resizing at runtime. These are the flag sizes used on
+# 32px and 64px tall displays: medal card (full height), result card
+# (1/3 height) and results summary.
+SIZED_FLAG_SIZES = [
+    (45, 30),
+    (93, 62),
+    (15, 10),
+    (31, 21),
+    (10, 7),
+]
+
 # Output directory
 SCRIPT_DIR = Path(__file__).parent
 OUTPUT_DIR = SCRIPT_DIR.parent / "assets" / "country_flags"
@@ -80,17 +99,39 @@ OLYMPIC_COUNTRIES = [
 # Using w40 (40px wide) for good quality before downsampling
 FLAGCDN_URL = "https://flagcdn.com/w40/{code}.png"
 
+# Concurrent downloads (flagcdn is a CDN, so a handful in flight is fine)
+MAX_WORKERS = 8
+
+# Shared keep-alive session with a connection pool sized to the worker count,
+# so each flag reuses an open HTTPS connection instead of a new TLS handshake
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = 'LEDMatrix-Olympics-Plugin/1.0'
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=3
+))
+
+
+def flatten_on_black(img: Image.Image) -> Image.Image:
+    """Composite an image with transparency onto a black background."""
+    img = img.convert('RGBA')
+    if np is None:
+        background = Image.new('RGB', img.size, (0, 0, 0))
+        background.paste(img, mask=img.split()[-1])
+        return background
+
+    # Against black the composite is just RGB scaled by alpha
+    rgba = np.asarray(img, dtype=np.float32)
+    rgb = rgba[..., :3] * (rgba[..., 3:4] / 255.0) + 0.5
+    return Image.fromarray(rgb.astype(np.uint8), 'RGB')
+
 
 def download_flag(ioc_code: str, iso2_code: str) -> bool:
     """Download a single flag and save as PNG."""
+    label = f"{ioc_code} ({iso2_code})"
     try:
         url = FLAGCDN_URL.format(code=iso2_code.lower())
 
-        print(f"  Downloading {ioc_code} ({iso2_code})...", end=" ", flush=True)
-
-        response = requests.get(url, timeout=10, headers={
-            'User-Agent': 'LEDMatrix-Olympics-Plugin/1.0'
-        })
+        response = SESSION.get(url, timeout=10)
         response.raise_for_status()
 
         # Open image from response
@@ -98,27 +139,26 @@ def download_flag(ioc_code: str, iso2_code: str) -> bool:
 
         # Convert to RGB if necessary (remove alpha)
         if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (0, 0, 0))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1])
-            img = background
-
-        # Resize to target size
-        img = img.resize(FLAG_SIZE, Image.Resampling.LANCZOS)
+            img = flatten_on_black(img)
 
-        # Save
+        # Resize to target size and save. reducing_gap box-reduces the
+        # source first so LANCZOS only convolves a near-final-size image
         output_path = OUTPUT_DIR / f"{ioc_code.lower()}.png"
-        img.save(output_path, 'PNG')
+        img.resize(FLAG_SIZE, Image.Resampling.LANCZOS, reducing_gap=2.0).save(output_path, 'PNG')
 
-        print("OK")
+        # Save pre-sized variants from the full-resolution source
+        for size in SIZED_FLAG_SIZES:
+            sized_path = OUTPUT_DIR / f"{size[0]}x{size[1]}" / f"{ioc_code.lower()}.png"
+            img.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0).save(sized_path, 'PNG')
+
+        print(f"  {label}... OK")
         return True
 
     except requests.RequestException as e:
-        print(f"FAILED (network: {e})")
+        print(f"  {label}... FAILED (network: {e})")
         return False
     except Exception as e:
-        print(f"FAILED ({e})")
+        print(f"  {label}... FAILED ({e})")
         return False
 
 
@@ -128,11 +168,14 @@ def main():
     print("=" * 50)
     print("Source: flagcdn.com")
     print(f"Target size: {FLAG_SIZE[0]}x{FLAG_SIZE[1]} pixels")
+    print(f"Sized variants: {', '.join(f'{w}x{h}' for w, h in SIZED_FLAG_SIZES)}")
     print(f"Output: {OUTPUT_DIR}")
     print()
 
-    # Create output directory
+    # Create output directories
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    for size in SIZED_FLAG_SIZES:
+        (OUTPUT_DIR / f"{size[0]}x{size[1]}").mkdir(exist_ok=True)
 
     # Download flags
     success = 0
@@ -141,14 +184,17 @@ def main():
     print(f"Downloading {len(OLYMPIC_COUNTRIES)} flags...")
     print()
 
-    for ioc_code, iso2_code in OLYMPIC_COUNTRIES:
-        if download_flag(ioc_code, iso2_code):
-            success += 1
-        else:
-            failed += 1
-
-        # Small delay to be nice to the server
-        time.sleep(0.2)
+    # Downloads are network-bound, so run them concurrently over one session
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(download_flag, ioc_code, iso2_code)
+            for ioc_code, iso2_code in OLYMPIC_COUNTRIES
+        ]
+        for future in as_completed(futures):
+            if future.result():
+                success += 1
+            else:
+                failed += 1
 
     print()
     print("=" * 50)
@@ -161,6 +207,8 @@ def main():
         print(f"  {OUTPUT_DIR}/")
         for f in sorted(OUTPUT_DIR.glob("*.png")):
             print(f"    {f.name}")
+        print()
+        print("Run scripts/pack_flags.py to pack the sized variants for faster loading.")
 
 
 if __name__ == "__main__":
@@ -2,8 +2,9 @@
 """Explore Olympics.com data structure for medal winners."""
 
 import json
-import requests
-from lxml import html
+from operator import itemgetter
+
+from _fetch import find_script_json, make_session
 
 URL = "https://www.olympics.com/en/milano-cortina-2026/medals"
 HEADERS = {
@@ -12,61 +13,61 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.5",
 }
 
+# Shared keep-alive session so retries reuse the open HTTPS connection
+SESSION = make_session(HEADERS)
+
 
 def main():
     """Fetch and explore medal data structure from Olympics.com."""
-    response = requests.get(URL, headers=HEADERS, timeout=15)
+    response = SESSION.get(URL, timeout=15)
     print(f"Status: {response.status_code}")
 
-    tree = html.fromstring(response.content)
-    scripts = tree.xpath("//script/text()")
-
-    for script in scripts:
-        if "result_medals_data" in script and len(script) > 1000:
-            data = json.loads(script)
-            medals_data = data["result_medals_data"]
+    data = find_script_json(response.content, "result_medals_data", min_length=1000)
+    if data is not None:
+        medals_data = data["result_medals_data"]
 
-            print("Top-level keys:", list(medals_data.keys()))
+        print("Top-level keys:", list(medals_data.keys()))
 
-            initial = medals_data.get("initialMedals", {})
-            print("initialMedals keys:", list(initial.keys()))
+        initial = medals_data.get("initialMedals", {})
+        print("initialMedals keys:", list(initial.keys()))
 
-            standings = initial.get("medalStandings", {})
-            table = standings.get("medalsTable", [])
+        standings = initial.get("medalStandings", {})
+        table = standings.get("medalsTable", [])
 
-            if table:
-                first = table[0]
-                org = first.get("organisation")
-                print(f"\nFirst country: {org}")
+        if table:
+            first = table[0]
+            org = first.get("organisation")
+            print(f"\nFirst country: {org}")
 
-                discs = first.get("disciplines", [])
-                if discs:
-                    d = discs[0]
-                    print(f"First discipline: {d.get('name')}")
+            discs = first.get("disciplines", [])
+            if discs:
+                d = discs[0]
+                print(f"First discipline: {d.get('name')}")
 
-                    winners = d.get("medalWinners", [])
-                    print(f"Medal winners: {len(winners)}")
+                winners = d.get("medalWinners", [])
+                print(f"Medal winners: {len(winners)}")
 
-                    if winners:
-                        print("\nFirst winner structure:")
-                        print(json.dumps(winners[0], indent=2))
+                if winners:
+                    print("\nFirst winner structure:")
+                    print(json.dumps(winners[0], indent=2))
 
-                        print("\n\nAll recent medal winners (first 5):")
-                        all_winners = []
-                        for country in table[:10]:
-                            for disc in country.get("disciplines", []):
-                                for w in disc.get("medalWinners", []):
+                    print("\n\nAll recent medal winners (first 5):")
+                    all_winners = []
+                    for country in table[:10]:
+                        for disc in country.get("disciplines", []):
+                            for w in disc.get("medalWinners", []):
+                                if w.get("date"):
                                     all_winners.append(w)
 
-                        # Sort by date
-                        all_winners.sort(key=lambda x: x.get("date", ""), reverse=True)
-                        for w in all_winners[:5]:
-                            medal = w.get("medalType", "").replace("ME_", "")
-                            name = w.get("competitorDisplayName", "Unknown")
-                            event_desc = w.get("eventDescription", "")
-                            winner_org = w.get("organisation", "")
-                            print(f"  {medal}: {name} ({winner_org}) - {event_desc}")
-            break
+                    # Sort by date (undated winners can't be recent)
+                    all_winners.sort(key=itemgetter("date"), reverse=True)
+                    for w in all_winners[:5]:
+                        get = w.get
+                        medal = get("medalType", "").replace("ME_", "")
+                        name = get("competitorDisplayName", "Unknown")
+                        event_desc = get("eventDescription", "")
+                        winner_org = get("organisation", "")
+                        print(f"  {medal}: {name} ({winner_org}) - {event_desc}")
 
 
 if __name__ == "__main__":
@@ -7,26 +7,47 @@ as a compact JSON file. This eliminates the need to fetch the 3MB
 schedule page during normal operation.
 
 Usage:
-    python scripts/generate_schedule.py
+    python scripts/generate_schedule.py [--force]
+
+The page's ETag/Last-Modified are saved next to the output so later runs
+send a conditional request and skip regeneration when the schedule page
+is unchanged (304). Pass --force to always download and regenerate.
 
 The output file (data/static_schedule.json) should be committed to
 the repository and updated periodically before/during the Olympics.
 """
 
+import importlib.util
 import json
 import sys
+from collections import Counter
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
+from sys import intern
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 try:
-    import requests
-    from lxml import html
+    from _fetch import find_script_json, make_session
 except ImportError:
     print("Required packages not installed. Run:")
     print("  pip install requests lxml")
     sys.exit(1)
 
+# orjson serializes the events several times faster
+try:
+    import orjson
+
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+# Only advertise brotli when urllib3 can decode it
+ACCEPT_ENCODING = "gzip, br" if importlib.util.find_spec("brotli") else "gzip"
+
 # Olympics configuration
 OLYMPICS_URL = "https://www.olympics.com/en/milano-cortina-2026/schedule"
 OLYMPICS_NAME = "Milano Cortina 2026"
@@ -36,124 +57,151 @@ OLYMPICS_END = "2026-02-22"
 # Output paths
 SCRIPT_DIR = Path(__file__).parent
 OUTPUT_FILE = SCRIPT_DIR.parent / "data" / "static_schedule.json"
+VALIDATORS_FILE = OUTPUT_FILE.with_suffix(".etag")
 
 USER_AGENT = "LEDMatrix-Olympics/2.0 (Schedule Generator)"
 
+# Shared keep-alive session so retries reuse the open HTTPS connection
+SESSION = make_session({"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING})
+
+
+def load_validators() -> Dict[str, str]:
+    """Load the ETag/Last-Modified saved from the previous fetch."""
+    try:
+        with open(VALIDATORS_FILE, encoding="utf-8") as f:
+            validators = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return validators if isinstance(validators, dict) else {}
+
+
+def save_validators(validators: Dict[str, str]) -> None:
+    """Save the fetched page's ETag/Last-Modified for the next run."""
+    with open(VALIDATORS_FILE, "w", encoding="utf-8") as f:
+        json.dump(validators, f, indent=2)
+
+
+def fetch_schedule_page(validators: Dict[str, str]):
+    """
+    Fetch the schedule page from Olympics.com.
 
-def fetch_schedule_page() -> str:
-    """Fetch the schedule page from Olympics.com."""
+    Sends If-None-Match/If-Modified-Since from the previous fetch when
+    available.
+
+    Returns:
+        (page bytes, new validators), or (None, validators) if the page is
+        unchanged since the previous fetch
+    """
     print(f"Fetching schedule from {OLYMPICS_URL}...")
 
-    response = requests.get(
-        OLYMPICS_URL,
-        headers={"User-Agent": USER_AGENT},
-        timeout=30
-    )
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = SESSION.get(OLYMPICS_URL, headers=headers, timeout=30)
+    if response.status_code == 304:
+        print("  Not modified since last run")
+        return None, validators
     response.raise_for_status()
 
     print(f"  Downloaded {len(response.content):,} bytes")
-    return response.text
+    new_validators = {
+        "etag": response.headers.get("ETag", ""),
+        "last_modified": response.headers.get("Last-Modified", ""),
+    }
+    # Raw bytes: lxml detects the charset itself, skipping a str decode copy
+    return response.content, new_validators
 
 
-def extract_schedule_data(page_content: str) -> dict:
+def extract_schedule_data(page_content: bytes) -> dict:
     """Extract schedule data from embedded JSON in the page."""
-    tree = html.fromstring(page_content)
-    scripts = tree.xpath("//script/text()")
-
-    for script in scripts:
-        if "result_schedule_data" not in script:
-            continue
-        if len(script) < 10000:
-            continue
-
-        try:
-            data = json.loads(script)
-            if "result_schedule_data" not in data:
-                continue
-            return data["result_schedule_data"]
-        except json.JSONDecodeError:
-            continue
-
-    raise ValueError("Could not find schedule data in page")
+    data = find_script_json(page_content, "result_schedule_data", min_length=10000)
+    if data is None:
+        raise ValueError("Could not find schedule data in page")
+    return data["result_schedule_data"]
 
 
 def parse_events(schedule_data: dict) -> list:
     """Parse all events from schedule data."""
-    events = []
+    # Collect (day key, day data) pairs in one pass; day keys sort chronologically
+    days = [item for item in schedule_data.items() if item[0].startswith("initialSchedule_")]
+    days.sort(key=itemgetter(0))
+    print(f"  Found {len(days)} days of events")
 
-    # Get all day keys
-    day_keys = [k for k in schedule_data.keys() if k.startswith("initialSchedule_")]
-    print(f"  Found {len(day_keys)} days of events")
-
-    for day_key in sorted(day_keys):
-        day_schedule = schedule_data.get(day_key, {})
-        units = day_schedule.get("units", [])
-
-        for unit in units:
-            event = parse_event(unit)
-            if event:
-                events.append(event)
+    # Flatten every day's units in day order, dropping units that don't parse
+    units = chain.from_iterable(day.get("units", ()) for _, day in days)
+    events = [event for event in map(parse_event, units) if event]
 
     # Sort by start time
-    events.sort(key=lambda e: e["start"])
+    events.sort(key=itemgetter("start"))
 
     return events
 
 
 def parse_event(unit: dict) -> Optional[dict]:
     """Parse a single event unit into a compact format."""
-    event_id = unit.get("id", "")
-    sport = unit.get("disciplineName", "")
-    event_name = unit.get("eventUnitName", "") or unit.get("eventName", "")
+    get = unit.get  # Bound once; called for every field of thousands of units
+
+    sport = get("disciplineName", "") or ""
+    event_name = get("eventUnitName", "") or get("eventName", "")
 
+    # Skip junk units before extracting any other fields
     if not sport and not event_name:
         return None
 
-    start_time = unit.get("startDate", "")
-    end_time = unit.get("endDate", "")
-    venue = unit.get("venueDescription", "") or unit.get("venueLongDescription", "")
-    round_name = unit.get("phaseName", "")
-    medal_event = unit.get("medalFlag", 0) == 1
+    event_id = get("id", "")
+    start_time = get("startDate", "")
+    end_time = get("endDate", "")
+    venue = get("venueDescription", "") or get("venueLongDescription", "") or ""
+    medal_event = get("medalFlag") == 1
 
     # Mark as final if it's a medal event with no round name
     # Don't append "Final" to existing round names (e.g., single-run medal events)
-    if medal_event and not round_name:
-        round_name = "Final"
+    round_name = get("phaseName", "") or ("Final" if medal_event else "")
 
+    # Sports, venues and rounds repeat across thousands of events: share
+    # one string object per distinct value
     return {
         "id": event_id,
-        "sport": sport,
+        "sport": intern(sport),
         "name": event_name,
         "start": start_time,
         "end": end_time,
-        "venue": venue,
-        "round": round_name,
+        "venue": intern(venue),
+        "round": intern(round_name),
         "medal": medal_event
     }
 
 
-def generate_schedule():
+def generate_schedule(force: bool = False):
     """Main function to generate the static schedule file."""
     print("=" * 60)
     print("Olympics Schedule Generator")
     print("=" * 60)
     print()
 
+    # Only make the request conditional if there is an output to keep
+    validators = {} if force or not OUTPUT_FILE.exists() else load_validators()
+
     # Fetch and parse
-    page_content = fetch_schedule_page()
+    page_content, validators = fetch_schedule_page(validators)
+    if page_content is None:
+        print(f"\nSchedule unchanged, keeping {OUTPUT_FILE}")
+        print("Run with --force to regenerate anyway.")
+        return
+
     schedule_data = extract_schedule_data(page_content)
     events = parse_events(schedule_data)
 
     print(f"  Parsed {len(events)} total events")
 
     # Count by sport
-    sports = {}
-    for event in events:
-        sport = event["sport"]
-        sports[sport] = sports.get(sport, 0) + 1
+    sports = Counter(event["sport"] for event in events)
 
     print("\nEvents by sport:")
-    for sport, count in sorted(sports.items(), key=lambda x: -x[1])[:10]:
+    for sport, count in sports.most_common(10):
         print(f"  {sport}: {count}")
 
     # Build output structure
@@ -172,10 +220,12 @@ def generate_schedule():
     # Write output
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(output, f, separators=(",", ":"))  # Compact JSON
+    # Compact UTF-8 JSON, written as bytes in one call
+    payload = json_dumps(output)
+    OUTPUT_FILE.write_bytes(payload)
+    save_validators(validators)
 
-    file_size = OUTPUT_FILE.stat().st_size
+    file_size = len(payload)
     print(f"\nOutput written to: {OUTPUT_FILE}")
     print(f"File size: {file_size:,} bytes ({file_size / 1024:.1f} KB)")
     print()
@@ -183,4 +233,4 @@ def generate_schedule():
 
 
 if __name__ == "__main__":
-    generate_schedule()
+    generate_schedule(force="--force" in sys.argv[1:])
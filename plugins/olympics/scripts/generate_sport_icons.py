@@ -5,6 +5,9 @@ Generate simple sport icons for the Olympics plugin.
 Creates 12x12 pixel icons for winter sports, suitable for LED matrix display.
 """
 
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image, ImageDraw
 
@@ -15,6 +18,9 @@ OUTPUT_DIR = SCRIPT_DIR.parent / "assets" / "sport_icons"
 # Icon size
 ICON_SIZE = (12, 12)
 
+# Icons are drawn and PNG-encoded in parallel (zlib releases the GIL)
+MAX_WORKERS = 8
+
 # Colors
 WHITE = (255, 255, 255)
 CYAN = (0, 200, 255)
@@ -28,6 +34,34 @@ YELLOW = (255, 215, 0)
 BLACK = (0, 0, 0)
 
 
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Frame one PNG chunk: length, type, data, CRC32 of type + data."""
+    return (struct.pack(">I", len(data)) + chunk_type + data
+            + struct.pack(">I", zlib.crc32(chunk_type + data)))
+
+
+def write_png(path: Path, img: Image.Image) -> None:
+    """
+    Write a small RGB image as a PNG assembled by hand.
+
+    An icon's pixels are a few hundred bytes, so one zlib.compress call over
+    the filter-0 scanlines replaces PIL's general-purpose encoder setup.
+    """
+    width, height = img.size
+    pixels = img.tobytes()
+    stride = width * 3
+    raw = b"".join(
+        b"\x00" + pixels[y * stride:(y + 1) * stride] for y in range(height)
+    )
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)  # 8-bit RGB
+    path.write_bytes(
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", ihdr)
+        + _png_chunk(b"IDAT", zlib.compress(raw, 9))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
 def create_icon(name: str, draw_func) -> None:
     """Create and save an icon."""
     img = Image.new('RGB', ICON_SIZE, BLACK)
@@ -35,7 +69,7 @@ def create_icon(name: str, draw_func) -> None:
     draw_func(draw)
 
     output_path = OUTPUT_DIR / f"{name}.png"
-    img.save(output_path, 'PNG')
+    write_png(output_path, img)
     print(f"  Created {name}.png")
 
 
@@ -250,8 +284,9 @@ def main():
 
     # Generate all icons
     print("Generating icons:")
-    for name, draw_func in SPORTS.items():
-        create_icon(name, draw_func)
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(SPORTS))) as executor:
+        # list() waits for every icon and re-raises any failure
+        list(executor.map(create_icon, SPORTS.keys(), SPORTS.values()))
 
     print()
     print(f"Created {len(SPORTS)} sport icons")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Pack pre-sized country flags into one raw RGB file per size.
+
+For every assets/country_flags/<width>x<height>/ directory written by
+download_flags.py, concatenates the flags' RGB pixels into
+flags_<width>x<height>.bin (fixed stride width*height*3) alongside a
+flags_<width>x<height>.json index of byte offsets. The renderers mmap the
+.bin once and slice flags out of it instead of decoding one PNG per flag.
+
+Usage:
+    python scripts/pack_flags.py
+"""
+
+import json
+import re
+from pathlib import Path
+from PIL import Image
+
+# Flag directories
+SCRIPT_DIR = Path(__file__).parent
+FLAGS_DIR = SCRIPT_DIR.parent / "assets" / "country_flags"
+
+SIZE_DIR_PATTERN = re.compile(r"^(\d+)x(\d+)$")
+
+
+def pack_size(size_dir: Path, size: tuple) -> int:
+    """Pack every flag in one size directory. Returns the number packed."""
+    offsets = {}
+    chunks = []
+    offset = 0
+
+    for flag_path in sorted(size_dir.glob("*.png")):
+        try:
+            with Image.open(flag_path) as img:
+                flag = img.convert("RGB")
+        except Exception as e:
+            print(f"  {flag_path.name}... SKIPPED ({e})")
+            continue
+        if flag.size != size:
+            print(f"  {flag_path.name}... SKIPPED (size {flag.size[0]}x{flag.size[1]})")
+            continue
+
+        data = flag.tobytes()
+        offsets[flag_path.stem.lower()] = offset
+        chunks.append(data)
+        offset += len(data)
+
+    name = f"flags_{size[0]}x{size[1]}"
+    (FLAGS_DIR / f"{name}.bin").write_bytes(b"".join(chunks))
+    (FLAGS_DIR / f"{name}.json").write_text(
+        json.dumps({"size": list(size), "offsets": offsets}, indent=2, sort_keys=True)
+    )
+    return len(offsets)
+
+
+def main():
+    print("=" * 50)
+    print("Olympics Plugin - Flag Packer")
+    print("=" * 50)
+    print(f"Flags: {FLAGS_DIR}")
+    print()
+
+    packed_sizes = 0
+    for size_dir in sorted(FLAGS_DIR.iterdir() if FLAGS_DIR.exists() else []):
+        match = SIZE_DIR_PATTERN.match(size_dir.name)
+        if not size_dir.is_dir() or not match:
+            continue
+        size = (int(match.group(1)), int(match.group(2)))
+        count = pack_size(size_dir, size)
+        print(f"  {size[0]}x{size[1]}: {count} flags")
+        packed_sizes += 1
+
+    print()
+    if packed_sizes == 0:
+        print("No sized flag directories found. Run scripts/download_flags.py first.")
+    else:
+        print(f"Packed {packed_sizes} flag sizes into {FLAGS_DIR}/flags_<w>x<h>.bin")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,10 +25,11 @@ The sequential block flow:
 - When all enabled leagues complete, the display mode cycle is complete
 """
 
-import hashlib
 import logging
+import sys
 import time
 import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Dict, Any, Set, Optional, Tuple, List
 
 try:
@@ -70,7 +71,12 @@ logger = logging.getLogger(__name__)
 
 # Predefined league keys and display names (priority 1-8)
 # Custom leagues will be added dynamically with user-defined priorities
-PREDEFINED_LEAGUE_KEYS = ['eng.1', 'esp.1', 'ger.1', 'ita.1', 'fra.1', 'usa.1', 'por.1', 'uefa.champions', 'uefa.europa']
+# League keys are interned: they key every registry, manager and settings lookup
+PREDEFINED_LEAGUE_KEYS = [
+    sys.intern(k)
+    for k in ('eng.1', 'esp.1', 'ger.1', 'ita.1', 'fra.1', 'usa.1', 'por.1', 'uefa.champions', 'uefa.europa')
+]
+PREDEFINED_LEAGUE_KEY_SET = frozenset(PREDEFINED_LEAGUE_KEYS)
 PREDEFINED_LEAGUE_NAMES = {
     'eng.1': 'Premier League',
     'esp.1': 'La Liga',
@@ -96,24 +102,57 @@ PREDEFINED_LEAGUE_PRIORITIES = {
     'uefa.europa': 9,
 }
 
-# League key -> (live_attr, recent_attr, upcoming_attr) for predefined leagues
-PREDEFINED_LEAGUE_ATTR_MAP = {
-    'eng.1': ('eng1_live', 'eng1_recent', 'eng1_upcoming'),
-    'esp.1': ('esp1_live', 'esp1_recent', 'esp1_upcoming'),
-    'ger.1': ('ger1_live', 'ger1_recent', 'ger1_upcoming'),
-    'ita.1': ('ita1_live', 'ita1_recent', 'ita1_upcoming'),
-    'fra.1': ('fra1_live', 'fra1_recent', 'fra1_upcoming'),
-    'usa.1': ('usa1_live', 'usa1_recent', 'usa1_upcoming'),
-    'por.1': ('por1_live', 'por1_recent', 'por1_upcoming'),
-    'uefa.champions': ('champions_live', 'champions_recent', 'champions_upcoming'),
-    'uefa.europa': ('europa_live', 'europa_recent', 'europa_upcoming'),
+# League key -> factory returning (live, recent, upcoming) managers for predefined leagues
+LEAGUE_FACTORY = {
+    'eng.1': create_premier_league_managers,
+    'esp.1': create_la_liga_managers,
+    'ger.1': create_bundesliga_managers,
+    'ita.1': create_serie_a_managers,
+    'fra.1': create_ligue_1_managers,
+    'usa.1': create_mls_managers,
+    'por.1': create_liga_portugal_managers,
+    'uefa.champions': create_champions_league_managers,
+    'uefa.europa': create_europa_league_managers,
 }
 
-# Legacy aliases for backwards compatibility. LEAGUE_NAMES is a mutable copy that
-# includes predefined leagues and can be extended with custom leagues. PREDEFINED_LEAGUE_NAMES
-# remains immutable for reference.
+# Seconds a has_live_content() result is reused. It is polled on every display
+# tick, while live games only change when the managers update.
+LIVE_CONTENT_CACHE_TTL = 0.5
+
+# Manager updates are I/O-bound (ESPN API calls); they run on a persistent pool.
+# The timeout applies per update from when a worker starts it, not from submit
+UPDATE_MAX_WORKERS = 4
+UPDATE_TIMEOUT = 25.0
+
+# Mode types in the order manager factories return their managers
+MODE_TYPES = ('live', 'recent', 'upcoming')
+
+# Marker set on a game dict once _collect_games_for_scroll has normalized it
+SCROLL_NORMALIZED_KEY = '_scroll_normalized'
+
+# Game state inferred from the mode type when a game's status has none
+MODE_TO_STATE = {'live': 'in', 'recent': 'post', 'upcoming': 'pre'}
+
+# Manager attributes holding the games for each mode type, in lookup order
+GAMES_ATTRS_BY_MODE = {
+    'live': ('live_games',),
+    'recent': ('games_list', 'recent_games'),
+    'upcoming': ('games_list', 'upcoming_games'),
+}
+
+
+def build_league_mode_keys(league_key: str) -> Tuple[str, str, str]:
+    """Build the (live, recent, upcoming) display mode names for a league."""
+    return tuple(f"soccer_{league_key}_{mode_type}" for mode_type in MODE_TYPES)
+
+
+# League key -> (live, recent, upcoming) display mode names for predefined leagues
+LEAGUE_MODE_KEYS = {k: build_league_mode_keys(k) for k in PREDEFINED_LEAGUE_KEYS}
+
+# Legacy alias for backwards compatibility. League display names live on each
+# plugin instance (seeded from PREDEFINED_LEAGUE_NAMES) so custom leagues never
+# leak into module state.
 LEAGUE_KEYS = PREDEFINED_LEAGUE_KEYS
-LEAGUE_NAMES = PREDEFINED_LEAGUE_NAMES.copy()
 
 
 class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
@@ -146,6 +185,9 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
 
         self.logger = logger
 
+        # League display names: predefined leagues plus this instance's custom leagues
+        self._league_names: Dict[str, str] = dict(PREDEFINED_LEAGUE_NAMES)
+
         # Basic configuration
         self.is_enabled = config.get("enabled", True)
         # Get display dimensions from display_manager properties
@@ -159,18 +201,18 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         # League configurations
         self.logger.debug(f"Soccer plugin received config keys: {list(config.keys())}")
         
+        # Top-level league sections, read once per config
+        self._cache_league_sections()
+
         # Check which leagues are enabled
-        leagues_config = config.get('leagues', {})
+        leagues_config = self._leagues_config
         self.league_enabled = {}
         for league_key in LEAGUE_KEYS:
             league_config = leagues_config.get(league_key, {})
             self.league_enabled[league_key] = league_config.get('enabled', False)
-            self.logger.debug(f"{LEAGUE_NAMES[league_key]} config: {league_config}")
+            self.logger.debug(f"{self._league_names[league_key]} config: {league_config}")
 
-        enabled_leagues = [k for k, v in self.league_enabled.items() if v]
-        self.logger.info(
-            f"League enabled states: {', '.join([LEAGUE_NAMES[k] for k in enabled_leagues]) if enabled_leagues else 'None'}"
-        )
+        self._refresh_enabled_leagues()
 
         # Global settings
         self.display_duration = float(config.get("display_duration", 30))
@@ -198,19 +240,40 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         # Format: {league_id: {'enabled': bool, 'priority': int, 'live_priority': bool, 'managers': {...}}}
         self._league_registry: Dict[str, Dict[str, Any]] = {}
 
+        # Manager instances keyed by (league_key, mode_type), for predefined and
+        # custom leagues alike
+        self._managers: Dict[Tuple[str, str], Any] = {}
+
+        # Display mode names per league; custom leagues are added as they load
+        self._league_mode_keys: Dict[str, Tuple[str, str, str]] = dict(LEAGUE_MODE_KEYS)
+
+        # Adapted manager configs per league code, valid while self.config is
+        # the same object (see _get_cached_adapted_config)
+        self._adapted_config_cache: Dict[str, Dict[str, Any]] = {}
+        self._adapted_config_sig: int = 0
+
+        # Global settings shared by every league's manager config
+        self._resolve_global_settings()
+
         # Initialize managers for predefined leagues
         self._initialize_managers()
 
         # Load and initialize custom leagues from config
         self._load_custom_leagues()
         self._build_custom_league_map()
+        self._refresh_enabled_leagues()
 
         # Initialize league registry after managers are created
         # This centralizes league management and makes it easy to add more leagues
         self._initialize_league_registry()
 
-        # Display mode settings per league and game type
-        self._display_mode_settings = self._parse_display_mode_settings()
+        # Display mode settings per league and game type, parsed lazily by the
+        # display_mode_settings property and re-parsed whenever its signature
+        # (config identity, custom league count) changes
+        self._display_mode_settings: Dict[str, Dict[str, str]] = {}
+        # Same settings keyed by (league_key, game_type) for _get_display_mode
+        self._display_mode_flat: Dict[Tuple[str, str], str] = {}
+        self._display_mode_settings_sig: Optional[Tuple[int, int]] = None
         
         # Initialize scroll display manager if available
         self._scroll_manager: Optional[ScrollDisplayManager] = None
@@ -232,8 +295,12 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         self._scroll_active: Dict[str, bool] = {}  # {scroll_key: is_active}
         self._scroll_prepared: Dict[str, bool] = {}  # {scroll_key: is_prepared}
 
-        # Track active update threads to prevent accumulation of stale threads
-        self._active_update_threads: Dict[str, threading.Thread] = {}  # {name: thread}
+        # Persistent worker pool for manager updates, plus the in-flight update
+        # per manager so a slow one is never queued twice
+        self._update_executor = ThreadPoolExecutor(
+            max_workers=UPDATE_MAX_WORKERS, thread_name_prefix="soccer-update"
+        )
+        self._pending_updates: Dict[str, Future] = {}  # {name: future}
 
         # Lock to protect shared mutable state during config reload
         self._config_lock = threading.Lock()
@@ -255,22 +322,23 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         self.logger.info(
             f"Soccer scoreboard plugin initialized - {self.display_width}x{self.display_height}"
         )
-        self.logger.info(
-            f"Enabled leagues: {', '.join([LEAGUE_NAMES[k] for k in enabled_leagues]) if enabled_leagues else 'None'}"
-        )
-
-        # Dynamic duration tracking
-        self._dynamic_cycle_seen_modes: Set[str] = set()
-        self._dynamic_mode_to_manager_key: Dict[str, str] = {}
-        self._dynamic_manager_progress: Dict[str, Set[str]] = {}
-        self._dynamic_managers_completed: Set[str] = set()
+        self._log_enabled_leagues("Enabled leagues")
+
+        # Dynamic duration tracking; seen modes are a bitmask over self.modes
+        # (see _build_dynamic_mode_bits)
+        self._dynamic_cycle_seen_mask = 0
+        # Manager keys are (display mode name, manager class name) tuples
+        self._dynamic_mode_to_manager_key: Dict[str, Tuple[str, str]] = {}
+        self._dynamic_manager_progress: Dict[Tuple[str, str], Set[str]] = {}
+        self._dynamic_managers_completed: Set[Tuple[str, str]] = set()
         self._dynamic_cycle_complete = False
+        self._build_dynamic_mode_bits()
 
         # Track when single-game managers were first seen to ensure full duration
         self._single_game_manager_start_times: Dict[str, float] = {}
         # Track when each game ID was first seen to ensure full per-game duration
         # Using game IDs instead of indices prevents start time resets when game order changes
-        self._game_id_start_times: Dict[str, Dict[str, float]] = {}  # {manager_key: {game_id: start_time}}
+        self._game_id_start_times: Dict[Tuple[str, str], float] = {}  # {(manager_key, game_id): start_time}
         # Track which managers were actually used for each display mode
         self._display_mode_to_managers: Dict[str, Set[str]] = {}  # {display_mode: {manager_key, ...}}
 
@@ -282,6 +350,10 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         self._last_live_content_false_log: float = 0.0  # Timestamp of last False log
         self._live_content_log_interval: float = 60.0  # Log False results every 60 seconds
 
+        # Last has_live_content() result as (time.monotonic() stamp, result);
+        # cleared whenever manager data or config changes
+        self._live_content_cache: Optional[Tuple[float, bool]] = None
+
         # Track last display mode to detect when we return after being away
         self._last_display_mode: Optional[str] = None  # Track previous display mode
         self._last_display_mode_time: float = 0.0  # When we last saw this mode
@@ -301,55 +373,44 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         """Initialize all manager instances."""
         try:
             # Initialize managers for each enabled league
-            for league_key in LEAGUE_KEYS:
-                if not self.league_enabled.get(league_key, False):
+            for league_key in self._enabled_league_keys:
+                # Custom leagues have no factory here; _load_custom_leagues builds them
+                factory = LEAGUE_FACTORY.get(league_key)
+                if factory is None:
                     continue
                 
                 league_config = self._adapt_config_for_manager(league_key)
                 
                 # Create managers based on league
-                if league_key == 'eng.1':
-                    self.eng1_live, self.eng1_recent, self.eng1_upcoming = create_premier_league_managers(
-                        league_config, self.display_manager, self.cache_manager
-                    )
-                elif league_key == 'esp.1':
-                    self.esp1_live, self.esp1_recent, self.esp1_upcoming = create_la_liga_managers(
-                        league_config, self.display_manager, self.cache_manager
-                    )
-                elif league_key == 'ger.1':
-                    self.ger1_live, self.ger1_recent, self.ger1_upcoming = create_bundesliga_managers(
-                        league_config, self.display_manager, self.cache_manager
-                    )
-                elif league_key == 'ita.1':
-                    self.ita1_live, self.ita1_recent, self.ita1_upcoming = create_serie_a_managers(
-                        league_config, self.display_manager, self.cache_manager
-                    )
-                elif league_key == 'fra.1':
-                    self.fra1_live, self.fra1_recent, self.fra1_upcoming = create_ligue_1_managers(
-                        league_config, self.display_manager, self.cache_manager
-                    )
-                elif league_key == 'usa.1':
-                    self.usa1_live, self.usa1_recent, self.usa1_upcoming = create_mls_managers(
-                        league_config, self.display_manager, self.cache_manager
-                    )
-                elif league_key == 'por.1':
-                    self.por1_live, self.por1_recent, self.por1_upcoming = create_liga_portugal_managers(
-                        league_config, self.display_manager, self.cache_manager
-                    )
-                elif league_key == 'uefa.champions':
-                    self.champions_live, self.champions_recent, self.champions_upcoming = create_champions_league_managers(
-                        league_config, self.display_manager, self.cache_manager
-                    )
-                elif league_key == 'uefa.europa':
-                    self.europa_live, self.europa_recent, self.europa_upcoming = create_europa_league_managers(
-                        league_config, self.display_manager, self.cache_manager
-                    )
-                
-                self.logger.info(f"{LEAGUE_NAMES[league_key]} managers initialized")
+                managers = factory(league_config, self.display_manager, self.cache_manager)
+                for mode_type, mode_manager in zip(MODE_TYPES, managers):
+                    self._managers[(league_key, mode_type)] = mode_manager
+
+                self.logger.info(f"{self._league_names[league_key]} managers initialized")
 
         except Exception as e:
             self.logger.error(f"Error initializing managers: {e}", exc_info=True)
 
+    def _log_enabled_leagues(self, label: str) -> None:
+        """Log the enabled leagues (predefined and custom) by display name."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        names = ", ".join(self._league_names.get(k, k) for k in self._enabled_league_keys)
+        self.logger.info("%s: %s", label, names or "None")
+
+    def _get_league_mode_keys(self, league_key: str) -> Tuple[str, str, str]:
+        """Get the (live, recent, upcoming) display mode names for a league."""
+        mode_keys = self._league_mode_keys.get(league_key)
+        if mode_keys is None:
+            mode_keys = self._league_mode_keys[league_key] = build_league_mode_keys(league_key)
+        return mode_keys
+
+    def _refresh_enabled_leagues(self) -> None:
+        """Rebuild the tuple of enabled league keys after league_enabled changes."""
+        self._enabled_league_keys: Tuple[str, ...] = tuple(
+            k for k, v in self.league_enabled.items() if v
+        )
+
     def _adapt_config_for_manager(self, league_key: str) -> Dict[str, Any]:
         """
         Adapt plugin config format to manager expected format.
@@ -357,18 +418,22 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         Plugin uses: leagues: {eng.1: {...}, esp.1: {...}, ...}
         Managers expect: soccer_eng.1_scoreboard: {...}, soccer_esp.1_scoreboard: {...}, ...
         """
-        leagues_config = self.config.get('leagues', {})
-        league_config = leagues_config.get(league_key, {})
+        cached = self._get_cached_adapted_config(league_key)
+        if cached is not None:
+            return cached
+
+        league_config = self._leagues_config.get(league_key, {})
         
         self.logger.debug(f"league_config for {league_key} = {league_config}")
 
         # Extract nested configurations
         display_modes_config = league_config.get("display_modes", {})
         
+        live_key, recent_key, upcoming_key = self._get_league_mode_keys(league_key)
         manager_display_modes = {
-            f"soccer_{league_key}_live": display_modes_config.get("live", True),
-            f"soccer_{league_key}_recent": display_modes_config.get("recent", True),
-            f"soccer_{league_key}_upcoming": display_modes_config.get("upcoming", True),
+            live_key: display_modes_config.get("live", True),
+            recent_key: display_modes_config.get("recent", True),
+            upcoming_key: display_modes_config.get("upcoming", True),
         }
 
         # Extract game limits from nested config if available
@@ -408,38 +473,74 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
             }
         }
 
-        # Add global config - get timezone from cache_manager's config_manager if available
+        # Add global config
+        manager_config.update(
+            {
+                "timezone": self._resolved_timezone,
+                "display": self._resolved_display_config,
+                "customization": self._resolved_customization,
+                # Shared by reference so managers don't each request one
+                "background_service_instance": self.background_service,
+            }
+        )
+
+        self.logger.debug(f"Using timezone: {self._resolved_timezone} for {league_key} managers")
+
+        self._adapted_config_cache[league_key] = manager_config
+        return manager_config
+
+    def _get_cached_adapted_config(self, league_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the adapted manager config built earlier for a league, if any.
+
+        The cache is keyed on the identity of self.config: replacing the config
+        dict (as a config reload does) drops every cached entry.
+        """
+        sig = id(self.config)
+        if sig != self._adapted_config_sig:
+            self._adapted_config_cache.clear()
+            self._adapted_config_sig = sig
+        return self._adapted_config_cache.get(league_key)
+
+    def _resolve_global_settings(self) -> None:
+        """
+        Resolve the timezone, display and customization settings shared by all leagues.
+
+        Called once per config (at init and on reload) instead of once per
+        league, so the cache_manager's config_manager is probed only once.
+        """
+        # Get timezone from cache_manager's config_manager if not set in plugin config
         timezone_str = self.config.get("timezone")
         if not timezone_str and hasattr(self.cache_manager, 'config_manager'):
             timezone_str = self.cache_manager.config_manager.get_timezone()
-        if not timezone_str:
-            timezone_str = "UTC"
-        
+        self._resolved_timezone: str = timezone_str or "UTC"
+
         # Get display config from main config if available
         display_config = self.config.get("display", {})
         if not display_config and hasattr(self.cache_manager, 'config_manager'):
             display_config = self.cache_manager.config_manager.get_display_config()
-        
-        # Get customization config from main config (shared across all leagues)
-        customization_config = self.config.get("customization", {})
-
-        manager_config.update(
-            {
-                "timezone": timezone_str,
-                "display": display_config,
-                "customization": customization_config,
-            }
-        )
+        # Hand the dimensions resolved in __init__ to every manager so they
+        # don't each probe display_manager again; copy so the main config's
+        # display section is left untouched
+        self._resolved_display_config: Dict[str, Any] = {
+            **(display_config or {}),
+            "width": self.display_width,
+            "height": self.display_height,
+        }
 
-        self.logger.debug(f"Using timezone: {timezone_str} for {league_key} managers")
+        # Get customization config from main config (shared across all leagues)
+        self._resolved_customization: Dict[str, Any] = self.config.get("customization", {})
 
-        return manager_config
+    def _cache_league_sections(self) -> None:
+        """Cache the config's leagues and custom_leagues sections for the current config."""
+        self._leagues_config: Dict[str, Any] = self.config.get('leagues', {})
+        self._custom_leagues_config: List[Dict[str, Any]] = self.config.get('custom_leagues', [])
 
     def _build_custom_league_map(self) -> None:
         """Build O(1) lookup map from custom_leagues config, keyed by league_code."""
         self._custom_league_map: Dict[str, Dict] = {
             cl['league_code']: cl
-            for cl in self.config.get('custom_leagues', [])
+            for cl in self._custom_leagues_config
             if cl.get('league_code')
         }
 
@@ -451,8 +552,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         if league_data.get('is_custom', False):
             return self._custom_league_map.get(league_key, {})
         else:
-            leagues_config = self.config.get('leagues', {})
-            return leagues_config.get(league_key, {})
+            return self._leagues_config.get(league_key, {})
 
     def _load_custom_leagues(self) -> None:
         """
@@ -465,9 +565,9 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         1. Reads custom_leagues array from config
         2. Creates managers for each enabled custom league
         3. Updates league_enabled and league_live_priority dicts
-        4. Updates LEAGUE_NAMES for display purposes
+        4. Updates _league_names for display purposes
         """
-        custom_leagues = self.config.get('custom_leagues', [])
+        custom_leagues = self._custom_leagues_config
 
         if not custom_leagues:
             self.logger.debug("No custom leagues configured")
@@ -477,11 +577,9 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
 
         # Track custom league keys for registry
         self._custom_league_keys: List[str] = []
-        # Map league_code -> safe_key actually used (may differ if collision fallback applied)
-        self._custom_league_safe_key: Dict[str, str] = {}
 
         for custom_league in custom_leagues:
-            league_code = custom_league.get('league_code', '').strip()
+            league_code = sys.intern(custom_league.get('league_code', '').strip())
             league_name = custom_league.get('name', '').strip()
             enabled = custom_league.get('enabled', True)
             priority = custom_league.get('priority', 50)
@@ -491,7 +589,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
                 continue
 
             # Validate against predefined leagues to prevent conflicts
-            if league_code in PREDEFINED_LEAGUE_KEYS:
+            if league_code in PREDEFINED_LEAGUE_KEY_SET:
                 self.logger.warning(
                     f"Skipping custom league with code '{league_code}' - conflicts with predefined league"
                 )
@@ -518,6 +616,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
 
             # Track this custom league
             self._custom_league_keys.append(league_code)
+            self._league_mode_keys[league_code] = build_league_mode_keys(league_code)
 
             # Update league enabled state
             self.league_enabled[league_code] = enabled
@@ -525,9 +624,8 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
             # Update live priority
             self.league_live_priority[league_code] = custom_league.get('live_priority', False)
 
-            # Add to LEAGUE_NAMES for display purposes
-            # Note: This modifies the module-level dict, but it's intentional for consistency
-            LEAGUE_NAMES[league_code] = league_name
+            # Add to league names for display purposes
+            self._league_names[league_code] = league_name
 
             # Store priority for registry initialization
             if not hasattr(self, '_custom_league_priorities'):
@@ -542,27 +640,9 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
             custom_league_config = self._adapt_config_for_custom_league(custom_league)
 
             try:
-                # Compute attribute names; guard against collisions (e.g. "foo.bar" vs "foo-bar"
-                # both sanitize to "foo_bar") to avoid overwriting existing managers.
-                safe_key = league_code.replace('.', '_').replace('-', '_')
-                live_attr = f'custom_{safe_key}_live'
-                recent_attr = f'custom_{safe_key}_recent'
-                upcoming_attr = f'custom_{safe_key}_upcoming'
-                if any(hasattr(self, a) for a in (live_attr, recent_attr, upcoming_attr)):
-                    suffix = hashlib.sha256(league_code.encode()).hexdigest()[:8]
-                    safe_key = f"{safe_key}_{suffix}"
-                    live_attr = f'custom_{safe_key}_live'
-                    recent_attr = f'custom_{safe_key}_recent'
-                    upcoming_attr = f'custom_{safe_key}_upcoming'
-                    self.logger.warning(
-                        "Custom league_code '%s' collides with another (sanitized); using unique "
-                        "suffix for attributes (custom_*_live/recent/upcoming) to avoid overwrite.",
-                        league_code,
-                    )
-                self._custom_league_safe_key[league_code] = safe_key
-
-                # Create managers for this custom league
-                live_manager, recent_manager, upcoming_manager = create_custom_league_managers(
+                # Create managers for this custom league. They are keyed by the
+                # raw league_code, so codes like "foo.bar" and "foo-bar" can't collide.
+                managers = create_custom_league_managers(
                     league_code=league_code,
                     league_name=league_name,
                     config=custom_league_config,
@@ -570,9 +650,8 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
                     cache_manager=self.cache_manager
                 )
 
-                setattr(self, live_attr, live_manager)
-                setattr(self, recent_attr, recent_manager)
-                setattr(self, upcoming_attr, upcoming_manager)
+                for mode_type, mode_manager in zip(MODE_TYPES, managers):
+                    self._managers[(league_code, mode_type)] = mode_manager
 
                 self.logger.info(f"Custom league {league_name} managers initialized")
 
@@ -592,6 +671,10 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
             Manager config dict with expected structure
         """
         league_code = custom_league.get('league_code', '')
+        cached = self._get_cached_adapted_config(league_code)
+        if cached is not None:
+            return cached
+
         league_name = custom_league.get('name', f"Custom ({league_code})")
 
         # Extract nested configurations
@@ -599,10 +682,11 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         game_limits = custom_league.get("game_limits", {})
         filtering = custom_league.get("filtering", {})
 
+        live_key, recent_key, upcoming_key = self._get_league_mode_keys(league_code)
         manager_display_modes = {
-            f"soccer_{league_code}_live": display_modes_config.get("live", True),
-            f"soccer_{league_code}_recent": display_modes_config.get("recent", True),
-            f"soccer_{league_code}_upcoming": display_modes_config.get("upcoming", True),
+            live_key: display_modes_config.get("live", True),
+            recent_key: display_modes_config.get("recent", True),
+            upcoming_key: display_modes_config.get("upcoming", True),
         }
 
         # Create manager config with expected structure
@@ -646,25 +730,15 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         }
 
         # Add global config
-        timezone_str = self.config.get("timezone")
-        if not timezone_str and hasattr(self.cache_manager, 'config_manager'):
-            timezone_str = self.cache_manager.config_manager.get_timezone()
-        if not timezone_str:
-            timezone_str = "UTC"
-
-        display_config = self.config.get("display", {})
-        if not display_config and hasattr(self.cache_manager, 'config_manager'):
-            display_config = self.cache_manager.config_manager.get_display_config()
-
-        # Get customization config from main config (shared across all leagues)
-        customization_config = self.config.get("customization", {})
-
         manager_config.update({
-            "timezone": timezone_str,
-            "display": display_config,
-            "customization": customization_config,
+            "timezone": self._resolved_timezone,
+            "display": self._resolved_display_config,
+            "customization": self._resolved_customization,
+            # Shared by reference so managers don't each request one
+            "background_service_instance": self.background_service,
         })
 
+        self._adapted_config_cache[league_code] = manager_config
         return manager_config
 
     def _initialize_league_registry(self) -> None:
@@ -697,56 +771,85 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         """
         # Add predefined leagues to registry
         for league_key in PREDEFINED_LEAGUE_KEYS:
-            attr_tuple = PREDEFINED_LEAGUE_ATTR_MAP.get(league_key)
-            if not attr_tuple:
-                continue
-            live_attr, recent_attr, upcoming_attr = attr_tuple
-
             self._league_registry[league_key] = {
                 'enabled': self.league_enabled.get(league_key, False),
                 'priority': PREDEFINED_LEAGUE_PRIORITIES.get(league_key, 99),
                 'live_priority': self.league_live_priority.get(league_key, False),
                 'is_custom': False,
                 'managers': {
-                    'live': getattr(self, live_attr, None),
-                    'recent': getattr(self, recent_attr, None),
-                    'upcoming': getattr(self, upcoming_attr, None),
+                    mode_type: self._managers.get((league_key, mode_type))
+                    for mode_type in MODE_TYPES
                 }
             }
 
         # Add custom leagues to registry
         custom_league_keys = getattr(self, '_custom_league_keys', [])
         custom_priorities = getattr(self, '_custom_league_priorities', {})
-        custom_safe_keys = getattr(self, '_custom_league_safe_key', {})
 
         for league_code in custom_league_keys:
-            safe_key = custom_safe_keys.get(
-                league_code,
-                league_code.replace('.', '_').replace('-', '_'),
-            )
-            live_attr = f'custom_{safe_key}_live'
-            recent_attr = f'custom_{safe_key}_recent'
-            upcoming_attr = f'custom_{safe_key}_upcoming'
-
             self._league_registry[league_code] = {
                 'enabled': self.league_enabled.get(league_code, False),
                 'priority': custom_priorities.get(league_code, 50),
                 'live_priority': self.league_live_priority.get(league_code, False),
                 'is_custom': True,
                 'managers': {
-                    'live': getattr(self, live_attr, None),
-                    'recent': getattr(self, recent_attr, None),
-                    'upcoming': getattr(self, upcoming_attr, None),
+                    mode_type: self._managers.get((league_code, mode_type))
+                    for mode_type in MODE_TYPES
                 }
             }
 
+        # Per-mode display_modes flags by league, so display code doesn't walk
+        # each league's config on every call
+        self._mode_enabled: Dict[str, Dict[str, bool]] = {mode_type: {} for mode_type in MODE_TYPES}
+        for league_id, league_data in self._league_registry.items():
+            display_modes = self._get_league_config(league_id, league_data).get("display_modes", {})
+            for mode_type in MODE_TYPES:
+                self._mode_enabled[mode_type][league_id] = display_modes.get(mode_type, True)
+
+        # Priority order only changes when the registry is rebuilt, so sort once
+        # here rather than on every display tick. The sort is stable: leagues
+        # with equal priority keep their registration order.
+        self._ordered_leagues: Tuple[Tuple[str, Dict[str, Any]], ...] = tuple(
+            sorted(self._league_registry.items(), key=lambda kv: kv[1].get('priority', 999))
+        )
+        self._enabled_ordered_leagues: Tuple[Tuple[str, Dict[str, Any]], ...] = tuple(
+            (lid, data) for lid, data in self._ordered_leagues if data.get('enabled', False)
+        )
+        # Flattening order for scroll games: priority, then league key as tie-breaker
+        self._priority_sorted_league_ids: Tuple[str, ...] = tuple(
+            sorted(self._league_registry, key=lambda k: (self._league_registry[k].get('priority', 999), k))
+        )
+        # Per-manager lookups keyed by manager id: the games attribute for
+        # _get_games_from_manager and the owning league for
+        # _set_display_context_from_manager
+        self._games_attr_by_manager: Dict[int, str] = {}
+        self._manager_league: Dict[int, str] = {}
+        # Display mode name -> manager, for the per-frame current manager lookup
+        self._mode_to_manager: Dict[str, Any] = {}
+        for league_id, league_data in self._league_registry.items():
+            for mode_name, mode_type in zip(self._get_league_mode_keys(league_id), MODE_TYPES):
+                manager = league_data['managers'].get(mode_type)
+                if manager is not None:
+                    self._mode_to_manager[mode_name] = manager
+            for mode_type, manager in league_data['managers'].items():
+                if manager is not None:
+                    self._manager_league[id(manager)] = league_id
+                    attr = self._resolve_games_attr(manager, mode_type)
+                    if attr:
+                        self._games_attr_by_manager[id(manager)] = attr
+        # Merged team rankings (see _get_rankings_cache); rebuilt with the registry
+        self._merged_rankings: Dict[str, int] = {}
+        self._merged_rankings_sig: Optional[Tuple[float, ...]] = None
+        # Per-mode results of _get_enabled_leagues_for_mode; rebuilt with the registry
+        self._enabled_leagues_by_mode: Dict[str, List[str]] = {}
+
         # Log registry state for debugging
         enabled_leagues = [lid for lid, data in self._league_registry.items() if data['enabled']]
         custom_count = len([lid for lid, data in self._league_registry.items() if data.get('is_custom', False)])
         self.logger.info(
             f"League registry initialized: {len(self._league_registry)} league(s) registered "
             f"({custom_count} custom), {len(enabled_leagues)} enabled: "
-            f"{[LEAGUE_NAMES.get(lid, lid) for lid in enabled_leagues]}"
+            f"{[self._league_names.get(lid, lid) for lid in enabled_leagues]}"
         )
 
     def _get_enabled_leagues_for_mode(self, mode_type: str) -> List[str]:
@@ -765,43 +868,30 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
             Example: ['eng.1', 'esp.1'] means Premier League shows first, then La Liga
 
         This is the core method for sequential block display - it determines
-        which leagues should be shown and in what order.
+        which leagues should be shown and in what order. Results are cached
+        per mode type until the registry is rebuilt; callers must not mutate
+        the returned list.
         """
-        enabled_leagues = []
-
-        # Iterate through all registered leagues
-        for league_id, league_data in self._league_registry.items():
-            # Check if league is enabled
-            if not league_data.get('enabled', False):
-                continue
-
-            # Check if this mode type is enabled for this league
-            # Get the league config to check display_modes settings
-            league_config = self._get_league_config(league_id, league_data)
+        cached = self._enabled_leagues_by_mode.get(mode_type)
+        if cached is not None:
+            return cached
 
-            display_modes_config = league_config.get("display_modes", {})
-
-            # Check the appropriate flag based on mode type
-            mode_enabled = True  # Default to enabled if not specified
-            if mode_type == 'live':
-                mode_enabled = display_modes_config.get("live", True)
-            elif mode_type == 'recent':
-                mode_enabled = display_modes_config.get("recent", True)
-            elif mode_type == 'upcoming':
-                mode_enabled = display_modes_config.get("upcoming", True)
-
-            # Only include if mode is enabled for this league
-            if mode_enabled:
-                enabled_leagues.append(league_id)
+        # Unknown mode types default to enabled for every league
+        mode_enabled = self._mode_enabled.get(mode_type, {})
 
-        # Sort by priority (lower number = higher priority)
-        enabled_leagues.sort(key=lambda lid: self._league_registry[lid].get('priority', 999))
+        # Iterate through enabled leagues, already in priority order, keeping
+        # those whose display_modes flag for this mode type is on
+        enabled_leagues = [
+            league_id for league_id, _ in self._enabled_ordered_leagues
+            if mode_enabled.get(league_id, True)
+        ]
 
         self.logger.debug(
             f"Enabled leagues for {mode_type} mode: {enabled_leagues} "
             f"(priorities: {[self._league_registry[lid].get('priority') for lid in enabled_leagues]})"
         )
 
+        self._enabled_leagues_by_mode[mode_type] = enabled_leagues
         return enabled_leagues
 
     def _is_league_complete_for_mode(self, league_id: str, mode_type: str) -> bool:
@@ -821,7 +911,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
             False otherwise
 
         The completion status is tracked in _dynamic_managers_completed set,
-        using manager keys in the format: "{league_id}_{mode_type}:ManagerClass"
+        using manager keys of the form ("soccer_{league_id}_{mode_type}", "ManagerClass")
         """
         # Get the manager for this league and mode
         manager = self._get_league_manager_for_mode(league_id, mode_type)
@@ -829,9 +919,10 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
             # No manager means league can't be displayed, so consider it "complete"
             return True
 
-        # Build the manager key that matches what's used in progress tracking
-        # Use "soccer_{league}_{mode}" to match _record_dynamic_progress (current_mode format)
-        manager_key = self._build_manager_key(f"soccer_{league_id}_{mode_type}", manager)
+        # Build the manager key that matches what's used in progress tracking;
+        # the precomputed mode name matches _record_dynamic_progress (current_mode format)
+        mode_name = self._get_league_mode_keys(league_id)[MODE_TYPES.index(mode_type)]
+        manager_key = self._build_manager_key(mode_name, manager)
 
         # Check if this manager is in the completed set
         is_complete = manager_key in self._dynamic_managers_completed
@@ -879,33 +970,38 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
 
     def _set_display_context_from_manager(self, manager, mode_type: str) -> None:
         """Set the current display context based on which manager is being used."""
-        # Try to determine league from manager class name or attributes
-        manager_class = manager.__class__.__name__
-
-        # Check for custom leagues first
-        if hasattr(manager, 'league_code'):
-            self._current_display_league = manager.league_code
-        elif 'PremierLeague' in manager_class or 'Eng1' in manager_class:
-            self._current_display_league = 'eng.1'
-        elif 'LaLiga' in manager_class or 'Esp1' in manager_class:
-            self._current_display_league = 'esp.1'
-        elif 'Bundesliga' in manager_class or 'Ger1' in manager_class:
-            self._current_display_league = 'ger.1'
-        elif 'SerieA' in manager_class or 'Ita1' in manager_class:
-            self._current_display_league = 'ita.1'
-        elif 'Ligue1' in manager_class or 'Fra1' in manager_class:
-            self._current_display_league = 'fra.1'
-        elif 'MLS' in manager_class or 'Usa1' in manager_class:
-            self._current_display_league = 'usa.1'
-        elif 'ChampionsLeague' in manager_class:
-            self._current_display_league = 'uefa.champions'
-        elif 'EuropaLeague' in manager_class:
-            self._current_display_league = 'uefa.europa'
-        else:
-            self._current_display_league = None
+        # Custom league managers carry their league_code; every other manager
+        # is looked up in the registry's manager -> league map
+        self._current_display_league = (
+            getattr(manager, 'league_code', None) or self._manager_league.get(id(manager))
+        )
 
         self._current_display_mode_type = mode_type
 
+    @property
+    def display_mode_settings(self) -> Dict[str, Dict[str, str]]:
+        """
+        Display mode settings per league, parsed from config on first use.
+
+        Cached until self.config is replaced or the number of custom leagues
+        changes; on_config_change also invalidates it explicitly.
+        """
+        self._refresh_display_mode_settings()
+        return self._display_mode_settings
+
+    def _refresh_display_mode_settings(self) -> None:
+        """Re-parse the display mode settings if their signature changed."""
+        sig = (id(self.config), len(getattr(self, '_custom_league_keys', ())))
+        if sig != self._display_mode_settings_sig:
+            settings = self._parse_display_mode_settings()
+            self._display_mode_settings = settings
+            self._display_mode_flat = {
+                (league_key, game_type): mode
+                for league_key, per_type in settings.items()
+                for game_type, mode in per_type.items()
+            }
+            self._display_mode_settings_sig = sig
+
     def _parse_display_mode_settings(self) -> Dict[str, Dict[str, str]]:
         """
         Parse display mode settings from config.
@@ -916,7 +1012,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         """
         settings = {}
 
-        leagues_config = self.config.get('leagues', {})
+        leagues_config = self._leagues_config
 
         # Parse predefined leagues
         for league_key in PREDEFINED_LEAGUE_KEYS:
@@ -929,10 +1025,10 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
                 'upcoming': display_modes_config.get('upcoming_display_mode', 'switch'),
             }
 
-            self.logger.debug(f"Display mode settings for {LEAGUE_NAMES.get(league_key, league_key)}: {settings[league_key]}")
+            self.logger.debug(f"Display mode settings for {self._league_names.get(league_key, league_key)}: {settings[league_key]}")
 
         # Parse custom leagues
-        custom_leagues = self.config.get('custom_leagues', [])
+        custom_leagues = self._custom_leagues_config
         for custom_league in custom_leagues:
             league_code = custom_league.get('league_code', '')
             if not league_code:
@@ -962,7 +1058,8 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         Returns:
             'switch' or 'scroll'
         """
-        return self._display_mode_settings.get(league_key, {}).get(game_type, 'switch')
+        self._refresh_display_mode_settings()
+        return self._display_mode_flat.get((league_key, game_type), 'switch')
 
     def _has_any_scroll_mode(self) -> bool:
         """Return True if any enabled league uses scroll for any mode type."""
@@ -1022,11 +1119,10 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
 
         # Build stable priority-sorted list of leagues across all mode types
         # Priority is determined by first mode_type that enables the league
-        ordered_leagues = []
+        ordered_leagues: Dict[str, None] = {}
         for mt in mode_types:
             for league_key in self._get_enabled_leagues_for_mode(mt):
-                if league_key not in ordered_leagues:
-                    ordered_leagues.append(league_key)
+                ordered_leagues.setdefault(league_key)
 
         # Collect games by league, iterating leagues outer, mode_types inner
         # This ensures stable league ordering regardless of which mode has games
@@ -1041,76 +1137,106 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
                 if manager:
                     league_games = self._get_games_from_manager(manager, mt)
                     if league_games:
-                        # Add league info and ensure status field
+                        # Group by league; a league with games stays listed even
+                        # if live priority filters all of them out
+                        league_bucket = games_by_league.setdefault(league_key, [])
+                        default_state = MODE_TO_STATE.get(mt, 'pre')
+                        # Add league info and ensure status field, skipping
+                        # non-live games up front when live priority is active
                         for game in league_games:
-                            if 'league' not in game:
-                                game['league'] = league_key
-                            # Normalize status to dict (handle None, non-dict, or missing)
-                            if not isinstance(game.get('status'), dict):
-                                game['status'] = {}
-                            if 'state' not in game['status']:
-                                # Infer state from mode_type
-                                state_map = {'live': 'in', 'recent': 'post', 'upcoming': 'pre'}
-                                game['status']['state'] = state_map.get(mt, 'pre')
-
-                        # Group by league
-                        if league_key not in games_by_league:
-                            games_by_league[league_key] = []
-                        games_by_league[league_key].extend(league_games)
-                        self.logger.debug(f"Collected {len(league_games)} {LEAGUE_NAMES.get(league_key, league_key)} {mt} games for scroll")
+                            if live_priority_active and (
+                                not game.get('is_live', False) or game.get('is_final', False)
+                            ):
+                                continue
+                            if SCROLL_NORMALIZED_KEY not in game:
+                                self._normalize_scroll_game(game, league_key, default_state)
+                            league_bucket.append(game)
+
+                        self.logger.debug(f"Collected {len(league_games)} {self._league_names.get(league_key, league_key)} {mt} games for scroll")
 
         # Flatten games list in registry priority order (only leagues with games)
-        # Lower priority number = higher priority, with league_key as tie-breaker
-        leagues = sorted(
-            [lk for lk in ordered_leagues if lk in games_by_league],
-            key=lambda lk: (
-                self._league_registry.get(lk, {}).get('priority', 999),
-                lk  # Tie-breaker: alphabetical by league_key
-            )
-        )
+        # Lower priority number = higher priority, with league_key as tie-breaker;
+        # the order is precomputed in _initialize_league_registry
+        leagues = [lk for lk in self._priority_sorted_league_ids if lk in games_by_league]
         for league_key in leagues:
             games.extend(games_by_league[league_key])
 
-        # If live priority is active, filter to only live games
+        # Live priority filtering already happened during collection
         if live_priority_active:
-            games = [g for g in games if g.get('is_live', False) and not g.get('is_final', False)]
             self.logger.debug(f"Live priority active: filtered to {len(games)} live games")
 
         return games, leagues
     
+    @staticmethod
+    def _normalize_scroll_game(game: Dict, league_key: str, default_state: str) -> None:
+        """
+        Add league info and a status dict with a state to a game, in place.
+
+        Marks the game with SCROLL_NORMALIZED_KEY so later scroll preps skip
+        it; managers build fresh game dicts on each fetch, so new data is
+        always normalized again.
+        """
+        if 'league' not in game:
+            game['league'] = league_key
+        # Normalize status to dict (handle None, non-dict, or missing)
+        if not isinstance(game.get('status'), dict):
+            game['status'] = {}
+        if 'state' not in game['status']:
+            # State inferred from the mode type (see MODE_TO_STATE)
+            game['status']['state'] = default_state
+        game[SCROLL_NORMALIZED_KEY] = True
+
+    @staticmethod
+    def _resolve_games_attr(manager, mode_type: str) -> Optional[str]:
+        """Return the first games attribute in GAMES_ATTRS_BY_MODE the manager sets."""
+        for attr in GAMES_ATTRS_BY_MODE.get(mode_type, ()):
+            if getattr(manager, attr, None) is not None:
+                return attr
+        return None
+
     def _get_games_from_manager(self, manager, mode_type: str) -> List[Dict]:
-        """Get games list from a manager based on mode type."""
-        if mode_type == 'live':
-            return list(getattr(manager, 'live_games', []) or [])
-        elif mode_type == 'recent':
-            # Try games_list first (used by recent managers), then recent_games
-            games = getattr(manager, 'games_list', None)
-            if games is None:
-                games = getattr(manager, 'recent_games', [])
-            return list(games or [])
-        elif mode_type == 'upcoming':
-            # Try games_list first (used by upcoming managers), then upcoming_games
-            games = getattr(manager, 'games_list', None)
-            if games is None:
-                games = getattr(manager, 'upcoming_games', [])
-            return list(games or [])
-        return []
+        """
+        Get games list from a manager based on mode type.
+
+        Recent and upcoming managers keep their filtered list in games_list,
+        falling back to recent_games/upcoming_games. Returns the manager's own
+        list (managers replace it rather than mutating it), so callers must
+        not modify it.
+        """
+        attr = self._games_attr_by_manager.get(id(manager))
+        if attr is None:
+            attr = self._resolve_games_attr(manager, mode_type)
+            if attr is None:
+                return []
+        return getattr(manager, attr, None) or []
     
     def _get_rankings_cache(self) -> Dict[str, int]:
-        """Get combined team rankings cache from all managers."""
-        rankings = {}
+        """
+        Get combined team rankings cache from all managers.
 
-        for league_data in self._league_registry.values():
-            if not league_data.get('enabled', False):
-                continue
-            managers = league_data.get('managers', {})
-            for mode_type in ('live', 'recent', 'upcoming'):
-                manager = managers.get(mode_type)
-                if manager:
-                    manager_rankings = getattr(manager, '_team_rankings_cache', {})
-                    if manager_rankings:
-                        rankings.update(manager_rankings)
+        Managers replace their rankings cache and stamp _rankings_cache_timestamp
+        on every refresh, so the merged dict is only rebuilt when one of those
+        timestamps changes. Callers must not modify the returned dict.
+        """
+        managers = [
+            manager
+            for league_data in self._league_registry.values()
+            if league_data.get('enabled', False)
+            for manager in league_data.get('managers', {}).values()
+            if manager
+        ]
+        sig = tuple(getattr(manager, '_rankings_cache_timestamp', 0) for manager in managers)
+        if sig == self._merged_rankings_sig:
+            return self._merged_rankings
+
+        rankings = {}
+        for manager in managers:
+            manager_rankings = getattr(manager, '_team_rankings_cache', {})
+            if manager_rankings:
+                rankings.update(manager_rankings)
 
+        self._merged_rankings = rankings
+        self._merged_rankings_sig = sig
         return rankings
     
     def _ensure_manager_updated(self, manager) -> None:
@@ -1129,17 +1255,13 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
             if not league_data.get('enabled', False):
                 continue
 
-            league_config = self._get_league_config(league_key, league_data)
-
-            display_modes = league_config.get("display_modes", {})
-
-            prefix = f"soccer_{league_key}"
-            if display_modes.get("live", True):
-                modes.append(f"{prefix}_live")
-            if display_modes.get("recent", True):
-                modes.append(f"{prefix}_recent")
-            if display_modes.get("upcoming", True):
-                modes.append(f"{prefix}_upcoming")
+            live_key, recent_key, upcoming_key = self._get_league_mode_keys(league_key)
+            if self._mode_enabled['live'][league_key]:
+                modes.append(live_key)
+            if self._mode_enabled['recent'][league_key]:
+                modes.append(recent_key)
+            if self._mode_enabled['upcoming'][league_key]:
+                modes.append(upcoming_key)
 
         # Default to Premier League if no leagues enabled
         if not modes:
@@ -1155,21 +1277,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         if not modes:
             return None
 
-        current_mode = modes[mode_index % len(modes)]
-
-        # Parse mode: soccer_{league_key}_{mode_type}
-        # Strip "soccer_" prefix and split from right to handle league codes with underscores
-        if not current_mode.startswith('soccer_'):
-            return None
-        mode_without_prefix = current_mode[7:]  # len('soccer_') = 7
-        parts = mode_without_prefix.rsplit('_', 1)
-        if len(parts) < 2:
-            return None
-
-        league_key = parts[0]  # e.g., 'eng.1' or custom league code (may contain underscores)
-        mode_type = parts[1]  # 'live', 'recent', 'upcoming'
-
-        return self._get_league_manager_for_mode(league_key, mode_type)
+        return self._get_manager_for_mode(modes[mode_index % len(modes)])
 
     def on_config_change(self, new_config: Dict[str, Any]) -> None:
         """Apply config changes at runtime without restart."""
@@ -1181,13 +1289,16 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         self.is_enabled = self.config.get("enabled", True)
 
         # Re-read league enabled states and live priority
-        leagues_config = self.config.get('leagues', {})
+        self._league_names = dict(PREDEFINED_LEAGUE_NAMES)
+        self._cache_league_sections()
+        leagues_config = self._leagues_config
         self.league_enabled = {}
         self.league_live_priority = {}
         for league_key in LEAGUE_KEYS:
             league_config = leagues_config.get(league_key, {})
             self.league_enabled[league_key] = league_config.get('enabled', False)
             self.league_live_priority[league_key] = league_config.get("live_priority", False)
+        self._refresh_enabled_leagues()
 
         # Re-read global settings
         self.display_duration = float(self.config.get("display_duration", 30))
@@ -1195,32 +1306,34 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
 
         # Acquire exclusive lock so display()/update() see consistent state
         with self._config_lock:
-            # Drain in-flight update threads before replacing managers
-            for name, thread in list(self._active_update_threads.items()):
-                if thread.is_alive():
-                    thread.join(timeout=10.0)
-            self._active_update_threads.clear()
+            # Drain in-flight updates before replacing managers
+            if self._pending_updates:
+                wait(list(self._pending_updates.values()), timeout=10.0)
+            self._pending_updates.clear()
 
             # Clear stale runtime caches before rebuilding
             self._league_registry.clear()
+            self._managers.clear()
+            self._adapted_config_cache.clear()
+            self._live_content_cache = None
             self._scroll_prepared.clear()
             self._scroll_active.clear()
 
             # Reinitialize managers and modes
+            self._resolve_global_settings()
             self._initialize_managers()
             self._load_custom_leagues()
             self._build_custom_league_map()
+            self._refresh_enabled_leagues()
             self._initialize_league_registry()
-            self._display_mode_settings = self._parse_display_mode_settings()
+            self._display_mode_settings_sig = None
             self.modes = self._get_available_modes()
+            self._build_dynamic_mode_bits()
+            self._dynamic_cycle_seen_mask = 0
             self.current_mode_index = 0
             self.enable_scrolling = self._has_any_scroll_mode()
 
-        enabled_leagues = [k for k, v in self.league_enabled.items() if v]
-        self.logger.info(
-            f"Config updated at runtime - reinitialized. Enabled leagues: "
-            f"{', '.join([LEAGUE_NAMES.get(k, k) for k in enabled_leagues]) if enabled_leagues else 'None'}"
-        )
+        self._log_enabled_leagues("Config updated at runtime - reinitialized. Enabled leagues")
 
     def update(self) -> None:
         """Update soccer game data using parallel manager updates."""
@@ -1239,7 +1352,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
             if not league_data.get('enabled', False):
                 continue
 
-            league_name = LEAGUE_NAMES.get(league_key, league_key)
+            league_name = self._league_names.get(league_key, league_key)
             managers = league_data.get('managers', {})
 
             for mode_type in ('live', 'recent', 'upcoming'):
@@ -1250,56 +1363,73 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         if not update_tasks:
             return
 
+        # Monotonic start time of each update, recorded by the worker running it
+        started: Dict[str, float] = {}
+
         # Run updates in parallel with individual error handling
         def run_update_with_error_handling(name: str, update_func):
             """Run a single manager update with error handling."""
+            started[name] = time.monotonic()
             try:
                 update_func()
             except Exception as e:
-                self.logger.error(f"Error updating {name} manager: {e}", exc_info=True)
+                # Runs every update interval, so keep the full traceback for DEBUG
+                self.logger.error(
+                    "Error updating %s manager: %r", name, e,
+                    exc_info=self.logger.isEnabledFor(logging.DEBUG),
+                )
 
-        # Start all update threads, skipping managers with still-running threads
-        threads = []
-        started_threads = {}  # Track name -> thread for cleanup
+        # Submit all updates, skipping managers whose previous update is still running
+        submitted = {}  # Track name -> future for cleanup
         with self._config_lock:
             for name, update_func in update_tasks:
-                # Check if a thread for this manager is still running
-                existing_thread = self._active_update_threads.get(name)
-                if existing_thread:
-                    if existing_thread.is_alive():
-                        self.logger.debug(
-                            f"Skipping update for {name} - previous thread still running"
+                existing = self._pending_updates.get(name)
+                if existing is not None and not existing.done():
+                    self.logger.debug(
+                        f"Skipping update for {name} - previous update still running"
+                    )
+                    continue
+
+                future = self._update_executor.submit(run_update_with_error_handling, name, update_func)
+                self._pending_updates[name] = future
+                submitted[name] = future
+
+        # Wait for the updates, giving each UPDATE_TIMEOUT from when it started.
+        # Queued updates only start as running ones finish, so stop once every
+        # worker is held by an overdue update
+        names = {future: name for name, future in submitted.items()}
+        not_done = set(submitted.values())
+        while not_done:
+            now = time.monotonic()
+            overdue = 0
+            deadlines = []
+            for future in not_done:
+                start = started.get(names[future])
+                if start is None:
+                    continue
+                if now - start >= UPDATE_TIMEOUT:
+                    overdue += 1
+                else:
+                    deadlines.append(start + UPDATE_TIMEOUT)
+            if overdue >= min(UPDATE_MAX_WORKERS, len(not_done)):
+                break
+            timeout = min(deadlines) - now if deadlines else UPDATE_TIMEOUT
+            _done, not_done = wait(not_done, timeout=timeout, return_when=FIRST_COMPLETED)
+
+        with self._config_lock:
+            for name, future in submitted.items():
+                if future in not_done:
+                    # Keep the entry in _pending_updates so the check above
+                    # prevents queueing this manager again until it finishes
+                    if future.running():
+                        self.logger.warning(
+                            f"Manager update {name} did not complete within timeout"
                         )
-                        continue
-                    else:
-                        # Thread completed, remove stale entry
-                        del self._active_update_threads[name]
-
-                thread = threading.Thread(
-                    target=run_update_with_error_handling,
-                    args=(name, update_func),
-                    daemon=True,
-                    name=f"Update-{name}"
-                )
-                thread.start()
-                threads.append(thread)
-                self._active_update_threads[name] = thread
-                started_threads[name] = thread
-
-        # Wait for all threads to complete with a reasonable timeout
-        for name, thread in started_threads.items():
-            thread.join(timeout=25.0)
-            if thread.is_alive():
-                self.logger.warning(
-                    f"Manager update thread {thread.name} did not complete within timeout"
-                )
-                # Keep entry in _active_update_threads so check at line 1145 prevents duplicate starts
-                # The entry will be removed when the thread eventually completes
-            else:
-                # Thread completed successfully, remove from tracking
-                with self._config_lock:
-                    if name in self._active_update_threads:
-                        del self._active_update_threads[name]
+                elif self._pending_updates.get(name) is future:
+                    del self._pending_updates[name]
+
+        # Live games may have changed; don't serve a stale has_live_content()
+        self._live_content_cache = None
 
     def _display_scroll_mode(self, display_mode: str, mode_type: str, force_clear: bool) -> bool:
         """Handle display for scroll mode.
@@ -1336,8 +1466,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
                 mode_type == 'live'
                 and any(
                     league_data.get('live_priority', False)
-                    for _lk, league_data in self._league_registry.items()
-                    if league_data.get('enabled', False)
+                    for _lk, league_data in self._enabled_ordered_leagues
                 )
                 and self.has_live_content()
             )
@@ -1364,7 +1493,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
                 self._scroll_active[scroll_key] = True
                 self.logger.info(
                     f"[Soccer Scroll] Started scrolling {len(games)} {mode_type} games "
-                    f"from {', '.join([LEAGUE_NAMES.get(l, l) for l in leagues])}"
+                    f"from {', '.join([self._league_names.get(l, l) for l in leagues])}"
                 )
             else:
                 self._scroll_prepared[scroll_key] = False
@@ -1696,7 +1825,11 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
                 return False
 
         except Exception as e:
-            self.logger.error(f"Error in display method: {e}", exc_info=True)
+            # Runs every frame, so keep the full traceback for DEBUG
+            self.logger.error(
+                "Error in display method: %r", e,
+                exc_info=self.logger.isEnabledFor(logging.DEBUG),
+            )
             return False
 
     def has_live_priority(self) -> bool:
@@ -1704,10 +1837,10 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         if not self.is_enabled:
             return False
         with self._config_lock:
-            registry = dict(self._league_registry)
+            enabled_leagues = self._enabled_ordered_leagues
         return any(
-            league_data.get('enabled', False) and league_data.get('live_priority', False)
-            for _lk, league_data in registry.items()
+            league_data.get('live_priority', False)
+            for _lk, league_data in enabled_leagues
         )
 
     def has_live_content(self) -> bool:
@@ -1715,12 +1848,20 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         if not self.is_enabled:
             return False
 
-        with self._config_lock:
-            registry = dict(self._league_registry)
-        for league_key, league_data in registry.items():
-            if not league_data.get('enabled', False):
-                continue
+        now = time.monotonic()
+        cached = self._live_content_cache
+        if cached is not None and now - cached[0] < LIVE_CONTENT_CACHE_TTL:
+            return cached[1]
+
+        result = self._scan_live_content()
+        self._live_content_cache = (now, result)
+        return result
 
+    def _scan_live_content(self) -> bool:
+        """Scan enabled leagues' live managers for displayable live games."""
+        with self._config_lock:
+            enabled_leagues = self._enabled_ordered_leagues
+        for league_key, league_data in enabled_leagues:
             live_manager = self._get_league_manager_for_mode(league_key, 'live')
             if not live_manager:
                 continue
@@ -1825,7 +1966,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         """Reset dynamic cycle tracking."""
         if BasePlugin:
             super().reset_cycle_state()
-        self._dynamic_cycle_seen_modes.clear()
+        self._dynamic_cycle_seen_mask = 0
         self._dynamic_mode_to_manager_key.clear()
         self._dynamic_manager_progress.clear()
         self._dynamic_managers_completed.clear()
@@ -1954,8 +2095,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
             if manager_duration is not None:
                 return float(manager_duration)
 
-        leagues_config = self.config.get('leagues', {})
-        league_config = leagues_config.get(league, {})
+        league_config = self._leagues_config.get(league, {})
         display_durations = league_config.get("display_durations", {})
         mode_duration = display_durations.get(mode_type)
         if mode_duration is not None:
@@ -1976,8 +2116,7 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         Returns:
             Mode duration in seconds (float) or None if not configured
         """
-        leagues_config = self.config.get('leagues', {})
-        league_config = leagues_config.get(league, {})
+        league_config = self._leagues_config.get(league, {})
         mode_durations = league_config.get("mode_durations", {})
 
         mode_duration_key = f"{mode_type}_mode_duration"
@@ -2070,6 +2209,11 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
 
     def _get_manager_for_mode(self, mode_name: str):
         """Resolve manager instance for a given display mode."""
+        manager = self._mode_to_manager.get(mode_name)
+        if manager is not None:
+            return manager
+
+        # Not a registered mode: parse soccer_{league_key}_{mode_type}
         # Strip "soccer_" prefix and split from right to handle league codes with underscores
         if not mode_name.startswith('soccer_'):
             return None
@@ -2083,17 +2227,31 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
 
         return self._get_league_manager_for_mode(league_key, mode_type)
 
+    def _build_dynamic_mode_bits(self) -> None:
+        """
+        Assign each display mode a bit for dynamic cycle tracking.
+
+        Bits are positional in self.modes, so this must be rebuilt (and the
+        seen mask cleared) whenever self.modes is reassigned.
+        """
+        self._dynamic_mode_bits: Dict[str, int] = {}
+        for mode_name in self.modes:
+            if mode_name and mode_name not in self._dynamic_mode_bits:
+                self._dynamic_mode_bits[mode_name] = 1 << len(self._dynamic_mode_bits)
+        self._required_dynamic_mode_mask = (1 << len(self._dynamic_mode_bits)) - 1
+
     def _record_dynamic_progress(self, current_manager) -> None:
         """Track progress through managers/games for dynamic duration."""
         with self._config_lock:
             modes = self.modes
             mode_index = self.current_mode_index
+            mode_bits = self._dynamic_mode_bits
         if not self._dynamic_feature_enabled() or not modes:
             self._dynamic_cycle_complete = True
             return
 
         current_mode = modes[mode_index % len(modes)]
-        self._dynamic_cycle_seen_modes.add(current_mode)
+        self._dynamic_cycle_seen_mask |= mode_bits.get(current_mode, 0)
 
         manager_key = self._build_manager_key(current_mode, current_manager)
         self._dynamic_mode_to_manager_key[current_mode] = manager_key
@@ -2128,19 +2286,20 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
 
         with self._config_lock:
             modes = self.modes
-        if not modes:
+            required_mask = self._required_dynamic_mode_mask
+        if not required_mask:
             self._dynamic_cycle_complete = True
             return
 
-        required_modes = [mode for mode in modes if mode]
-        if not required_modes:
-            self._dynamic_cycle_complete = True
+        # Every required mode must have been shown; a single mask compare
+        # skips the per-mode walk on every non-terminal tick
+        if self._dynamic_cycle_seen_mask & required_mask != required_mask:
+            self._dynamic_cycle_complete = False
             return
 
-        for mode_name in required_modes:
-            if mode_name not in self._dynamic_cycle_seen_modes:
-                self._dynamic_cycle_complete = False
-                return
+        for mode_name in modes:
+            if not mode_name:
+                continue
 
             manager_key = self._dynamic_mode_to_manager_key.get(mode_name)
             if not manager_key:
@@ -2159,9 +2318,9 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
         self._dynamic_cycle_complete = True
 
     @staticmethod
-    def _build_manager_key(mode_name: str, manager) -> str:
+    def _build_manager_key(mode_name: str, manager) -> Tuple[str, str]:
         manager_name = manager.__class__.__name__ if manager else "None"
-        return f"{mode_name}:{manager_name}"
+        return (mode_name, manager_name)
 
     @staticmethod
     def _get_total_games_for_manager(manager) -> int:
@@ -2288,6 +2447,8 @@ class SoccerScoreboardPlugin(BasePlugin if BasePlugin else object):
             if hasattr(self, "background_service") and self.background_service:
                 # Clean up background service if needed
                 pass
+            if hasattr(self, "_update_executor"):
+                self._update_executor.shutdown(wait=False, cancel_futures=True)
             if hasattr(self, "_scroll_manager") and self._scroll_manager:
                 # Clean up scroll manager if it has cleanup method
                 if hasattr(self._scroll_manager, "cleanup"):
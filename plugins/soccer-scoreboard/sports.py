@@ -47,8 +47,13 @@ class SportsCore(ABC):
         self.odds_manager = BaseOddsManager(self.cache_manager, self.config_manager)
         self.display_manager = display_manager
         # Get display dimensions from matrix (same as base SportsCore class)
-        # This ensures proper scaling for different display sizes
-        if hasattr(display_manager, 'matrix') and display_manager.matrix is not None:
+        # This ensures proper scaling for different display sizes; the plugin
+        # passes the dimensions it already resolved in the display config
+        display_config = config.get("display") or {}
+        if "width" in display_config and "height" in display_config:
+            self.display_width = display_config["width"]
+            self.display_height = display_config["height"]
+        elif hasattr(display_manager, 'matrix') and display_manager.matrix is not None:
             self.display_width = display_manager.matrix.width
             self.display_height = display_manager.matrix.height
         else:
@@ -148,25 +153,32 @@ class SportsCore(ABC):
 
         # Initialize background data service with optimized settings
         # Hardcoded for memory optimization: 1 worker, 30s timeout, 3 retries
-        try:
-            from src.background_data_service import get_background_service
-
-            self.background_service = get_background_service(
-                self.cache_manager, max_workers=1
-            )
+        shared_service = config.get("background_service_instance")
+        if shared_service is not None:
+            # Reuse the plugin's service so every league shares one worker pool
+            self.background_service = shared_service
             self.background_fetch_requests = {}  # Track background fetch requests
             self.background_enabled = True
-            self.logger.info(
-                "Background service enabled with 1 worker (memory optimized)"
-            )
-        except ImportError:
-            # Fallback if background service is not available
-            self.background_service = None
-            self.background_fetch_requests = {}
-            self.background_enabled = False
-            self.logger.warning(
-                "Background service not available - using synchronous fetching"
-            )
+        else:
+            try:
+                from src.background_data_service import get_background_service
+
+                self.background_service = get_background_service(
+                    self.cache_manager, max_workers=1
+                )
+                self.background_fetch_requests = {}  # Track background fetch requests
+                self.background_enabled = True
+                self.logger.info(
+                    "Background service enabled with 1 worker (memory optimized)"
+                )
+            except ImportError:
+                # Fallback if background service is not available
+                self.background_service = None
+                self.background_fetch_requests = {}
+                self.background_enabled = False
+                self.logger.warning(
+                    "Background service not available - using synchronous fetching"
+                )
 
     def _initialize_logo_dir(self, configured_path: Path) -> Path:
         """Resolve and ensure a writable logo directory, falling back when necessary."""